@@ -23,549 +23,896 @@ Schools
   └── Classes
         └── Students
               └── Grades
-
-TODO CHECKLIST:
-[ ] Implement Schools endpoints (GET, POST, DELETE)
-[ ] Implement Classes nested under Schools
-[ ] Implement Students nested under Classes
-[ ] Implement Grades nested under Students
-[ ] Validate parent resources exist before creating children
-[ ] Implement cascading deletes (deleting school deletes classes and students)
-[ ] Add flat alternative endpoints for convenience
-[ ] Auto-update student counts
 """
 
-from flask import Flask, request
-from flask_restx import Api, Resource, fields, Namespace
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
+from flask_restx import Api, Resource, fields, Namespace, Model
 from flask_cors import CORS
+from flask_compress import Compress
 from datetime import datetime
+import functools
+import itertools
+import math
+import orjson
+import os
+import threading
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+# flask-restx already builds the Swagger spec lazily, on the first request
+# to /swagger.json. What it does per request is deep-copy the model
+# (Model.resolved) every time marshal_with runs. Our models never change
+# after import, so resolve each one once and reuse it.
+
+class StaticModel(Model):
+    """Model whose resolved copy is computed on first use and then cached."""
+
+    @functools.cached_property
+    def resolved(self):
+        return Model.resolved.fget(self)
+
+class StaticNamespace(Namespace):
+    """Namespace that registers StaticModels instead of plain Models."""
+
+    def model(self, name=None, model=None, mask=None, strict=False, **kwargs):
+        definition = StaticModel(name, model, mask=mask, strict=strict)
+        definition.__apidoc__.update(kwargs)
+        return self.add_model(name, definition)
+
+schools_ns = StaticNamespace('schools', description='School operations')
+
+school_model = schools_ns.model('School', {
+    'id': fields.Integer(readonly=True, description='School ID'),
+    'name': fields.String(required=True, description='School name'),
+    'address': fields.String(required=True, description='School address'),
+    'principal': fields.String(description='Principal name'),
+    'student_count': fields.Integer(description='Total students')
+})
+
+class_model = schools_ns.model('Class', {
+    'id': fields.Integer(readonly=True, description='Class ID'),
+    'school_id': fields.Integer(required=True, description='School ID'),
+    'name': fields.String(required=True, description='Class name'),
+    'subject': fields.String(required=True, description='Subject taught'),
+    'teacher': fields.String(required=True, description='Teacher name'),
+    'student_count': fields.Integer(description='Number of students')
+})
+
+student_model = schools_ns.model('Student', {
+    'id': fields.Integer(readonly=True, description='Student ID'),
+    'class_id': fields.Integer(required=True, description='Class ID'),
+    'school_id': fields.Integer(required=True, description='School ID'),
+    'name': fields.String(required=True, description='Student name'),
+    'email': fields.String(required=True, description='Student email'),
+    'enrollment_date': fields.String(description='Enrollment date'),
+    'gpa': fields.Float(description='Grade Point Average')
+})
+
+grade_model = schools_ns.model('Grade', {
+    'id': fields.Integer(readonly=True, description='Grade ID'),
+    'student_id': fields.Integer(required=True, description='Student ID'),
+    'subject': fields.String(required=True, description='Subject'),
+    'grade': fields.String(required=True, description='Letter grade'),
+    'score': fields.Float(required=True, description='Numeric score'),
+    'date': fields.String(description='Grade date')
+})
+
+# ============================================================================
+# IN-MEMORY DATA STORAGE
+# ============================================================================
+
+# Records are stored by id: lookups and deletes are O(1) dict operations,
+# and dicts keep insertion order for the list endpoints.
+#
+# The stores, indexes and id counters live at module level, so every app
+# that create_app() builds in one process shares the same records and id
+# sequences; test clients that need isolated data must reload this module.
+schools_by_id = {
+    1: {
+        'id': 1,
+        'name': 'Lincoln High School',
+        'address': '123 Main St',
+        'principal': 'Dr. Sarah Smith',
+        'student_count': 2
+    }
+}
+
+classes_by_id = {
+    1: {
+        'id': 1,
+        'school_id': 1,
+        'name': 'Grade 10A',
+        'subject': 'Mathematics',
+        'teacher': 'Mr. Johnson',
+        'student_count': 2
+    }
+}
+
+students_by_id = {
+    1: {
+        'id': 1,
+        'class_id': 1,
+        'school_id': 1,
+        'name': 'Alice Wilson',
+        'email': 'alice@example.com',
+        'enrollment_date': '2024-01-15',
+        'gpa': 3.8
+    },
+    2: {
+        'id': 2,
+        'class_id': 1,
+        'school_id': 1,
+        'name': 'Bob Chen',
+        'email': 'bob@example.com',
+        'enrollment_date': '2024-01-15',
+        'gpa': 3.6
+    }
+}
+
+grades_by_id = {
+    1: {
+        'id': 1,
+        'student_id': 1,
+        'subject': 'Math',
+        'grade': 'A',
+        'score': 95.0,
+        'date': '2024-03-01'
+    }
+}
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+# Today's UTC date and its 'YYYY-MM-DD' string, reformatted only when the
+# date changes rather than on every POST
+_today_cache = {'d': None, 's': ''}
+
+def today_str():
+    """Return today's UTC date as 'YYYY-MM-DD', formatting it once per day."""
+    d = datetime.utcnow().date()
+    c = _today_cache
+    if c['d'] != d:
+        # Store the string before the date so a concurrent reader never
+        # pairs the new date with yesterday's string.
+        c['s'] = d.isoformat()
+        c['d'] = d
+    return c['s']
+
+def compile_marshaller(model):
+    """
+    Generate a plain function that projects a stored dict onto a model.
+
+    flask-restx's marshal walks each field object for every row; for our
+    fixed, flat models we can build the equivalent dict literal once, e.g.
+    ``def _dump(o): return {'id': o.get('id'), 'name': o.get('name'), ...}``.
+    """
+    src = 'def _dump(o): return {' + ', '.join(f'{k!r}: o.get({k!r})' for k in model) + '}'
+    namespace = {}
+    exec(src, namespace)
+    return namespace['_dump']
+
+dump_school = compile_marshaller(school_model)
+dump_class = compile_marshaller(class_model)
+dump_student = compile_marshaller(student_model)
+dump_grade = compile_marshaller(grade_model)
+
+def compile_required_check(*required):
+    """
+    Generate a straight-line validator for a POST payload.
+
+    Like a compiled JSON schema, the check is built once at import, e.g.
+    ``def _check(d): return isinstance(d, dict) and 'name' in d and 'email' in d``,
+    so handlers don't loop over a required-field list on every request.
+    Non-object bodies (a JSON list, null, ...) fail the check instead of
+    raising TypeError on the ``in`` test.
+    """
+    src = 'def _check(d): return isinstance(d, dict)' + ''.join(f' and {k!r} in d' for k in required)
+    namespace = {}
+    exec(src, namespace)
+    return namespace['_check']
+
+# The POST handlers run these checks themselves, so their @expect decorators
+# pass validate=False: the model only documents the body in Swagger, and a
+# global RESTX_VALIDATE=True won't add a jsonschema pass on every request.
+check_school_payload = compile_required_check('name', 'address')
+check_class_payload = compile_required_check('name', 'subject', 'teacher')
+check_student_payload = compile_required_check('name', 'email')
+check_grade_payload = compile_required_check('subject', 'grade', 'score')
+
+def parse_number(value):
+    """Return value as a finite float (numbers or numeric strings), else None."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+# Monotonic id allocators: O(1) per create instead of max() over the store,
+# and ids are never reused after a delete.
+next_school_id = itertools.count(max(schools_by_id, default=0) + 1)
+next_class_id = itertools.count(max(classes_by_id, default=0) + 1)
+next_student_id = itertools.count(max(students_by_id, default=0) + 1)
+next_grade_id = itertools.count(max(grades_by_id, default=0) + 1)
+
+# Find a record by ID (None if missing). Bound dict.get methods are called
+# directly in C, with no Python wrapper frame per lookup.
+find_school_by_id = schools_by_id.get
+find_class_by_id = classes_by_id.get
+find_student_by_id = students_by_id.get
+find_grade_by_id = grades_by_id.get
+
+# Parent -> child id indexes (foreign key lookups without scanning).
+# Ids are handed out in increasing order, so sorting a set gives back
+# insertion order for the list endpoints.
+classes_by_school = {}
+students_by_class = {}
+students_by_school = {}
+grades_by_student = {}
+
+def _index_seed_data():
+    """Populate the parent -> child indexes from the seed data."""
+    for c in classes_by_id.values():
+        classes_by_school.setdefault(c['school_id'], set()).add(c['id'])
+    for s in students_by_id.values():
+        students_by_class.setdefault(s['class_id'], set()).add(s['id'])
+        students_by_school.setdefault(s['school_id'], set()).add(s['id'])
+    for g in grades_by_id.values():
+        grades_by_student.setdefault(g['student_id'], set()).add(g['id'])
+
+_index_seed_data()
+
+# Readers don't take write_lock, so an id read from an index may already be
+# deleted from its store by a concurrent DELETE; .get skips those instead of
+# raising KeyError.
+
+def get_classes_for_school(school_id):
+    """Get all classes belonging to a school."""
+    found = map(classes_by_id.get, sorted(classes_by_school.get(school_id, ())))
+    return [c for c in found if c is not None]
+
+def get_students_for_class(class_id):
+    """Get all students in a class."""
+    found = map(students_by_id.get, sorted(students_by_class.get(class_id, ())))
+    return [s for s in found if s is not None]
+
+def get_grades_for_student(student_id):
+    """Get all grades for a student."""
+    found = map(grades_by_id.get, sorted(grades_by_student.get(student_id, ())))
+    return [g for g in found if g is not None]
+
+def update_class_student_count(class_id):
+    """Update student count for a class."""
+    cls = classes_by_id.get(class_id)
+    if cls:
+        cls['student_count'] = len(students_by_class.get(class_id, ()))
+
+def update_school_student_count(school_id):
+    """Update student counts for a school and every class in it."""
+    for class_id in classes_by_school.get(school_id, ()):
+        update_class_student_count(class_id)
+    school = schools_by_id.get(school_id)
+    if school:
+        school['student_count'] = len(students_by_school.get(school_id, ()))
+
+def validate_parent_child_relationship(school_id, class_id):
+    """
+    Validate that a class belongs to a school.
+
+    WHY?: For nested endpoints like /schools/{school_id}/classes/{class_id}/students,
+    we need to verify the class actually belongs to that school.
+    """
+    cls = classes_by_id.get(class_id)
+    return cls is not None and cls['school_id'] == school_id
+
+def resolve_hierarchy(school_id, class_id=None, student_id=None):
+    """
+    Look up a school → class → student path in one pass.
+
+    Returns (school, cls, student, error) where error is None or a
+    (status, message) tuple ready for ``abort(*error)``. A class that
+    belongs to school_id implies the school exists (deleting a school
+    cascades to its classes), so the school is only checked separately
+    when the class lookup fails and we need the right 404 message.
+    """
+    school = schools_by_id.get(school_id)
+    if class_id is None:
+        if school is None:
+            return None, None, None, (404, f'School {school_id} not found')
+        return school, None, None, None
+
+    cls = classes_by_id.get(class_id)
+    if cls is None or cls['school_id'] != school_id:
+        if school is None:
+            return None, None, None, (404, f'School {school_id} not found')
+        return school, None, None, (404, f'Class {class_id} not found in school {school_id}')
+    if student_id is None:
+        return school, cls, None, None
+
+    student = students_by_id.get(student_id)
+    if student is None or student['class_id'] != class_id:
+        return school, cls, None, (404, f'Student {student_id} not found in class {class_id}')
+    return school, cls, student, None
+
+# ============================================================================
+# CONCURRENCY
+# ============================================================================
+
+# Flask's dev server is threaded, so handlers can run concurrently.
+# Every handler that mutates the stores holds write_lock, including its
+# parent lookups; readers never take it. Readers copy what they iterate in
+# one C-level call (list(d.values()), sorted(index_set)), atomic under the
+# GIL, and look ids up with .get, so a concurrent write can't make them
+# raise mid-iteration or on an id that was just deleted.
+write_lock = threading.Lock()
+
+# ============================================================================
+# LIST RESPONSE CACHE
+# ============================================================================
+
+# List GETs are memoized on their URL parameters and tagged with the data
+# version they were built from. Writers bump the version (with write_lock
+# held, after mutating), which drops every cached list at once; an entry
+# computed concurrently with a write carries the old version and is ignored.
+_data_version = 0
+_list_cache = {}
+
+def bump_data_version():
+    """Invalidate cached list responses. Call after mutating, under write_lock."""
+    global _data_version
+    _data_version += 1
+    _list_cache.clear()
+
+def cached_list(func):
+    """Serve a list GET from _list_cache until the next write."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        version = _data_version
+        hit = _list_cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        result = func(self, *args, **kwargs)
+        _list_cache[key] = (version, result)
+        return result
+    return wrapper
+
+# ============================================================================
+# SCHOOLS ENDPOINTS
+# ============================================================================
+
+@schools_ns.route('/')
+class SchoolList(Resource):
+    """Schools collection."""
+
+    @schools_ns.doc('list_schools')
+    @schools_ns.response(200, 'Success', [school_model])
+    @cached_list
+    def get(self):
+        """List all schools."""
+        return [dump_school(s) for s in list(schools_by_id.values())]
+
+    @schools_ns.doc('create_school')
+    @schools_ns.expect(school_model, validate=False)
+    @schools_ns.response(201, 'Created', school_model)
+    def post(self):
+        """
+        Create a new school.
+
+        STEPS:
+        1. Get request data
+        2. Validate required fields (name, address)
+        3. Generate new ID
+        4. Set student_count to 0
+        5. Add to schools store
+        6. Return school with 201
+        """
+        data = request.get_json(force=True, silent=True, cache=True) or {}
+
+        if not check_school_payload(data):
+            schools_ns.abort(400, 'name and address are required')
+
+        with write_lock:
+            school = {
+                'id': next(next_school_id),
+                'name': data['name'],
+                'address': data['address'],
+                'principal': data.get('principal'),
+                'student_count': 0
+            }
+            schools_by_id[school['id']] = school
+            bump_data_version()
+
+        return school, 201
+
+@schools_ns.route('/<int:school_id>')
+@schools_ns.param('school_id', 'School identifier')
+class SchoolItem(Resource):
+    """Single school."""
+
+    @schools_ns.doc('get_school')
+    @schools_ns.marshal_with(school_model)
+    def get(self, school_id):
+        """Get school by ID."""
+        school = find_school_by_id(school_id)
+        if not school:
+            schools_ns.abort(404, f'School {school_id} not found')
+        return school
+
+    @schools_ns.doc('delete_school')
+    @schools_ns.response(204, 'School deleted')
+    def delete(self, school_id):
+        """
+        Delete school and cascade to classes and students.
+
+        STEPS:
+        1. Find school (404 if not found)
+        2. Get all classes in this school
+        3. For each class, delete all students in that class
+        4. Delete all classes in this school
+        5. Delete the school
+        6. Return 204
+
+        CASCADING DELETE: When you delete a school, all related
+        classes and students should also be deleted.
+        """
+        with write_lock:
+            if school_id not in schools_by_id:
+                schools_ns.abort(404, f'School {school_id} not found')
+
+            # Walk the indexes and delete exactly the affected records
+            for student_id in students_by_school.pop(school_id, ()):
+                for grade_id in grades_by_student.pop(student_id, ()):
+                    del grades_by_id[grade_id]
+                del students_by_id[student_id]
+            for class_id in classes_by_school.pop(school_id, ()):
+                students_by_class.pop(class_id, None)
+                del classes_by_id[class_id]
+            del schools_by_id[school_id]
+            bump_data_version()
+
+        return '', 204
+
+# ============================================================================
+# CLASSES ENDPOINTS (Nested under Schools)
+# ============================================================================
+
+@schools_ns.route('/<int:school_id>/classes')
+@schools_ns.param('school_id', 'School identifier')
+class ClassList(Resource):
+    """Classes in a school."""
+
+    @schools_ns.doc('list_classes_in_school')
+    @schools_ns.response(200, 'Success', [class_model])
+    @cached_list
+    def get(self, school_id):
+        """
+        List all classes in a school.
+
+        STEPS:
+        1. Verify school exists (404 if not)
+        2. Get all classes for this school
+        3. Return classes list
+        """
+        if not find_school_by_id(school_id):
+            schools_ns.abort(404, f'School {school_id} not found')
+        return [dump_class(c) for c in get_classes_for_school(school_id)]
+
+    @schools_ns.doc('create_class_in_school')
+    @schools_ns.expect(class_model, validate=False)
+    @schools_ns.response(201, 'Created', class_model)
+    def post(self, school_id):
+        """
+        Create a class in a school.
+
+        STEPS:
+        1. Get request data
+        2. Validate required fields (name, subject, teacher)
+        3. Verify school exists (404 if not) - PARENT VALIDATION
+        4. Generate new ID
+        5. Set school_id from URL parameter
+        6. Set student_count to 0
+        7. Add to classes store
+        8. Return class with 201
+
+        KEY CONCEPT: We automatically set school_id from the URL,
+        ensuring the class belongs to the correct school.
+        """
+        data = request.get_json(force=True, silent=True, cache=True) or {}
+        if not check_class_payload(data):
+            schools_ns.abort(400, 'Required fields: name, subject, teacher')
+
+        with write_lock:
+            # Check the parent under the lock so a concurrent cascade delete
+            # can't remove it between the check and the insert
+            if not find_school_by_id(school_id):
+                schools_ns.abort(404, f'School {school_id} not found')
+
+            cls = {
+                'id': next(next_class_id),
+                'school_id': school_id,
+                'name': data['name'],
+                'subject': data['subject'],
+                'teacher': data['teacher'],
+                'student_count': 0
+            }
+            classes_by_id[cls['id']] = cls
+            classes_by_school.setdefault(school_id, set()).add(cls['id'])
+            bump_data_version()
+
+        return cls, 201
+
+@schools_ns.route('/<int:school_id>/classes/<int:class_id>')
+@schools_ns.param('school_id', 'School identifier')
+@schools_ns.param('class_id', 'Class identifier')
+class ClassItem(Resource):
+    """Single class in a school."""
+
+    @schools_ns.doc('get_class')
+    @schools_ns.marshal_with(class_model)
+    def get(self, school_id, class_id):
+        """
+        Get a specific class.
+
+        STEPS:
+        1. Verify school exists (404 if not)
+        2. Find class (404 if not found)
+        3. Verify class belongs to school (404 if mismatch)
+        4. Return class
+
+        VALIDATION: We check that the class actually belongs to
+        the specified school, preventing access to /schools/1/classes/999
+        if class 999 belongs to school 2.
+        """
+        _, cls, _, error = resolve_hierarchy(school_id, class_id)
+        if error:
+            schools_ns.abort(*error)
+        return cls
+
+    @schools_ns.doc('update_class')
+    @schools_ns.expect(class_model, validate=False)
+    @schools_ns.marshal_with(class_model)
+    def put(self, school_id, class_id):
+        """
+        Update a class.
+
+        HINT: Similar to GET but update fields
+        HINT: Validate parent-child relationship
+        """
+        data = request.get_json(force=True, silent=True, cache=True) or {}
+        if not isinstance(data, dict):
+            schools_ns.abort(400, 'Request body must be a JSON object')
+
+        with write_lock:
+            _, cls, _, error = resolve_hierarchy(school_id, class_id)
+            if error:
+                schools_ns.abort(*error)
+
+            for field in ('name', 'subject', 'teacher'):
+                if field in data:
+                    cls[field] = data[field]
+            bump_data_version()
+
+        return cls
+
+    @schools_ns.doc('delete_class')
+    @schools_ns.response(204, 'Class deleted')
+    def delete(self, school_id, class_id):
+        """
+        Delete a class and its students.
+
+        STEPS:
+        1. Verify school exists
+        2. Find class and verify it belongs to school
+        3. Delete all students in this class
+        4. Delete the class
+        5. Update school's student count
+        6. Return 204
+        """
+        with write_lock:
+            error = resolve_hierarchy(school_id, class_id)[3]
+            if error:
+                schools_ns.abort(*error)
+
+            for student_id in students_by_class.pop(class_id, ()):
+                for grade_id in grades_by_student.pop(student_id, ()):
+                    del grades_by_id[grade_id]
+                del students_by_id[student_id]
+                students_by_school[school_id].discard(student_id)
+            del classes_by_id[class_id]
+            classes_by_school[school_id].discard(class_id)
+            update_school_student_count(school_id)
+            bump_data_version()
+
+        return '', 204
+
+# ============================================================================
+# STUDENTS ENDPOINTS (Nested under Classes)
+# ============================================================================
+
+@schools_ns.route('/<int:school_id>/classes/<int:class_id>/students')
+@schools_ns.param('school_id', 'School identifier')
+@schools_ns.param('class_id', 'Class identifier')
+class StudentList(Resource):
+    """Students in a class."""
+
+    @schools_ns.doc('list_students_in_class')
+    @schools_ns.response(200, 'Success', [student_model])
+    @cached_list
+    def get(self, school_id, class_id):
+        """
+        List all students in a class.
+
+        STEPS:
+        1. Verify school exists
+        2. Verify class exists and belongs to school
+        3. Get all students in this class
+        4. Return students list
+        """
+        error = resolve_hierarchy(school_id, class_id)[3]
+        if error:
+            schools_ns.abort(*error)
+        return [dump_student(s) for s in get_students_for_class(class_id)]
+
+    @schools_ns.doc('create_student')
+    @schools_ns.expect(student_model, validate=False)
+    @schools_ns.response(201, 'Created', student_model)
+    def post(self, school_id, class_id):
+        """
+        Enroll a student in a class.
+
+        STEPS:
+        1. Get request data
+        2. Validate required fields (name, email)
+        3. Verify school exists
+        4. Verify class exists and belongs to school
+        5. Generate new ID
+        6. Set school_id and class_id from URL
+        7. Set enrollment_date to today (use today_str())
+        8. Add to students store
+        9. Update class student count
+        10. Update school student count
+        11. Return student with 201
+        """
+        data = request.get_json(force=True, silent=True, cache=True) or {}
+        if not check_student_payload(data):
+            schools_ns.abort(400, 'name and email are required')
+        gpa = data.get('gpa')
+        if gpa is not None:
+            gpa = parse_number(gpa)
+            if gpa is None:
+                schools_ns.abort(400, 'gpa must be a number')
+
+        with write_lock:
+            error = resolve_hierarchy(school_id, class_id)[3]
+            if error:
+                schools_ns.abort(*error)
+
+            student = {
+                'id': next(next_student_id),
+                'class_id': class_id,
+                'school_id': school_id,
+                'name': data['name'],
+                'email': data['email'],
+                'enrollment_date': today_str(),
+                'gpa': gpa
+            }
+            students_by_id[student['id']] = student
+            students_by_class.setdefault(class_id, set()).add(student['id'])
+            students_by_school.setdefault(school_id, set()).add(student['id'])
+            update_class_student_count(class_id)
+            update_school_student_count(school_id)
+            bump_data_version()
+
+        return student, 201
+
+@schools_ns.route('/<int:school_id>/classes/<int:class_id>/students/<int:student_id>')
+@schools_ns.param('school_id', 'School identifier')
+@schools_ns.param('class_id', 'Class identifier')
+@schools_ns.param('student_id', 'Student identifier')
+class StudentItem(Resource):
+    """Single student."""
+
+    @schools_ns.doc('get_student')
+    @schools_ns.marshal_with(student_model)
+    def get(self, school_id, class_id, student_id):
+        """Get a student, validating the full school → class → student hierarchy."""
+        _, _, student, error = resolve_hierarchy(school_id, class_id, student_id)
+        if error:
+            schools_ns.abort(*error)
+        return student
+
+    @schools_ns.doc('delete_student')
+    @schools_ns.response(204, 'Student deleted')
+    def delete(self, school_id, class_id, student_id):
+        """
+        Delete a student.
+
+        STEPS:
+        1. Validate hierarchy (school → class → student)
+        2. Delete student's grades
+        3. Delete student
+        4. Update class student count
+        5. Update school student count
+        6. Return 204
+        """
+        with write_lock:
+            error = resolve_hierarchy(school_id, class_id, student_id)[3]
+            if error:
+                schools_ns.abort(*error)
+
+            for grade_id in grades_by_student.pop(student_id, ()):
+                del grades_by_id[grade_id]
+            del students_by_id[student_id]
+            students_by_class[class_id].discard(student_id)
+            students_by_school[school_id].discard(student_id)
+            update_class_student_count(class_id)
+            update_school_student_count(school_id)
+            bump_data_version()
+
+        return '', 204
+
+# ============================================================================
+# GRADES ENDPOINTS (Nested under Students)
+# ============================================================================
+
+@schools_ns.route('/<int:school_id>/classes/<int:class_id>/students/<int:student_id>/grades')
+@schools_ns.param('school_id', 'School identifier')
+@schools_ns.param('class_id', 'Class identifier')
+@schools_ns.param('student_id', 'Student identifier')
+class GradeList(Resource):
+    """Grades for a student."""
+
+    @schools_ns.doc('list_student_grades')
+    @schools_ns.response(200, 'Success', [grade_model])
+    @cached_list
+    def get(self, school_id, class_id, student_id):
+        """Get all grades for a student."""
+        error = resolve_hierarchy(school_id, class_id, student_id)[3]
+        if error:
+            schools_ns.abort(*error)
+        return [dump_grade(g) for g in get_grades_for_student(student_id)]
+
+    @schools_ns.doc('create_grade')
+    @schools_ns.expect(grade_model, validate=False)
+    @schools_ns.response(201, 'Created', grade_model)
+    def post(self, school_id, class_id, student_id):
+        """Add a grade for a student."""
+        data = request.get_json(force=True, silent=True, cache=True) or {}
+        if not check_grade_payload(data):
+            schools_ns.abort(400, 'Required fields: subject, grade, score')
+        score = parse_number(data['score'])
+        if score is None:
+            schools_ns.abort(400, 'score must be a number')
+
+        with write_lock:
+            error = resolve_hierarchy(school_id, class_id, student_id)[3]
+            if error:
+                schools_ns.abort(*error)
+
+            grade = {
+                'id': next(next_grade_id),
+                'student_id': student_id,
+                'subject': data['subject'],
+                'grade': data['grade'],
+                'score': score,
+                'date': data.get('date', today_str())
+            }
+            grades_by_id[grade['id']] = grade
+            grades_by_student.setdefault(student_id, set()).add(grade['id'])
+            bump_data_version()
+
+        return grade, 201
+
+# ============================================================================
+# FLAT ALTERNATIVE ENDPOINTS (For convenience)
+# ============================================================================
+
+# Sometimes nested URLs are too long. Provide flat alternatives for common queries.
+
+students_flat_ns = StaticNamespace('students', description='Student operations (flat)')
+
+@students_flat_ns.route('/<int:id>')
+@students_flat_ns.param('id', 'Student identifier')
+class StudentFlat(Resource):
+    """
+    Flat student endpoint (alternative to nested).
+
+    WHY?: /schools/1/classes/2/students/3 is very long.
+    Sometimes you just want /students/3
+    """
+
+    @students_flat_ns.doc('get_student_flat')
+    @students_flat_ns.marshal_with(student_model)
+    def get(self, id):
+        """
+        Get student by ID (flat endpoint).
+
+        BENEFIT: Shorter URL when you already know the student ID
+        """
+        student = find_student_by_id(id)
+        if not student:
+            students_flat_ns.abort(404, f'Student {id} not found')
+        return student
+
+@students_flat_ns.route('/<int:id>/grades')
+@students_flat_ns.param('id', 'Student identifier')
+class StudentGradesFlat(Resource):
+    """Get grades without full hierarchy."""
+
+    @students_flat_ns.doc('get_student_grades_flat')
+    @students_flat_ns.response(200, 'Success', [grade_model])
+    @cached_list
+    def get(self, id):
+        """
+        Get all grades for a student (flat).
+
+        BENEFIT: /students/3/grades is much shorter than the nested version
+        """
+        if not find_student_by_id(id):
+            students_flat_ns.abort(404, f'Student {id} not found')
+        return [dump_grade(g) for g in get_grades_for_student(id)]
+
+# ============================================================================
+# JSON SERIALIZATION
+# ============================================================================
+
+# orjson encodes the plain dicts/lists our handlers return several times
+# faster than the stdlib json module that Flask and flask-restx use.
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider (jsonify, request.get_json) backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """flask-restx representation for application/json, encoded with orjson."""
+    return Response(orjson.dumps(data), status=code, headers=headers,
+                    mimetype='application/json')
+
+# ============================================================================
+# APP FACTORY
+# ============================================================================
 
 def create_app():
     """
     Create the School Management API.
 
     This API demonstrates nested resources and hierarchical design.
+    Namespaces, models, data and resources above are built once at import
+    time; the factory only wires them into a fresh Flask app.
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     CORS(app)
 
+    # Keep 404 bodies to the handler's message: the default help text runs a
+    # difflib match of the URL against every route on each miss.
+    app.config['RESTX_ERROR_404_HELP'] = False
+
+    # List responses are repetitive JSON and compress well; skip tiny bodies
+    # where the compression overhead isn't worth it.
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
     api = Api(
         app,
         version='4.0',
         title='School Management API',
         description='Exercise 4: Master Nested Resources',
-        doc='/swagger'
+        doc='/swagger',
+        # Marshal into plain dicts (insertion-ordered since 3.7), never OrderedDict
+        ordered=False
     )
-
-    # ============================================================================
-    # DATA MODELS
-    # ============================================================================
-
-    schools_ns = Namespace('schools', description='School operations')
-
-    school_model = schools_ns.model('School', {
-        'id': fields.Integer(readonly=True, description='School ID'),
-        'name': fields.String(required=True, description='School name'),
-        'address': fields.String(required=True, description='School address'),
-        'principal': fields.String(description='Principal name'),
-        'student_count': fields.Integer(description='Total students')
-    })
-
-    class_model = schools_ns.model('Class', {
-        'id': fields.Integer(readonly=True, description='Class ID'),
-        'school_id': fields.Integer(required=True, description='School ID'),
-        'name': fields.String(required=True, description='Class name'),
-        'subject': fields.String(required=True, description='Subject taught'),
-        'teacher': fields.String(required=True, description='Teacher name'),
-        'student_count': fields.Integer(description='Number of students')
-    })
-
-    student_model = schools_ns.model('Student', {
-        'id': fields.Integer(readonly=True, description='Student ID'),
-        'class_id': fields.Integer(required=True, description='Class ID'),
-        'school_id': fields.Integer(required=True, description='School ID'),
-        'name': fields.String(required=True, description='Student name'),
-        'email': fields.String(required=True, description='Student email'),
-        'enrollment_date': fields.String(description='Enrollment date'),
-        'gpa': fields.Float(description='Grade Point Average')
-    })
-
-    grade_model = schools_ns.model('Grade', {
-        'id': fields.Integer(readonly=True, description='Grade ID'),
-        'student_id': fields.Integer(required=True, description='Student ID'),
-        'subject': fields.String(required=True, description='Subject'),
-        'grade': fields.String(required=True, description='Letter grade'),
-        'score': fields.Float(required=True, description='Numeric score'),
-        'date': fields.String(description='Grade date')
-    })
-
-    # ============================================================================
-    # IN-MEMORY DATA STORAGE
-    # ============================================================================
-
-    schools = [
-        {
-            'id': 1,
-            'name': 'Lincoln High School',
-            'address': '123 Main St',
-            'principal': 'Dr. Sarah Smith',
-            'student_count': 2
-        }
-    ]
-
-    classes = [
-        {
-            'id': 1,
-            'school_id': 1,
-            'name': 'Grade 10A',
-            'subject': 'Mathematics',
-            'teacher': 'Mr. Johnson',
-            'student_count': 2
-        }
-    ]
-
-    students = [
-        {
-            'id': 1,
-            'class_id': 1,
-            'school_id': 1,
-            'name': 'Alice Wilson',
-            'email': 'alice@example.com',
-            'enrollment_date': '2024-01-15',
-            'gpa': 3.8
-        },
-        {
-            'id': 2,
-            'class_id': 1,
-            'school_id': 1,
-            'name': 'Bob Chen',
-            'email': 'bob@example.com',
-            'enrollment_date': '2024-01-15',
-            'gpa': 3.6
-        }
-    ]
-
-    grades = [
-        {
-            'id': 1,
-            'student_id': 1,
-            'subject': 'Math',
-            'grade': 'A',
-            'score': 95.0,
-            'date': '2024-03-01'
-        }
-    ]
-
-    # ============================================================================
-    # HELPER FUNCTIONS
-    # ============================================================================
-
-    def find_school_by_id(school_id):
-        """Find school by ID."""
-        # TODO: Implement this helper
-        pass
-
-    def find_class_by_id(class_id):
-        """Find class by ID."""
-        # TODO: Implement this helper
-        pass
-
-    def find_student_by_id(student_id):
-        """Find student by ID."""
-        # TODO: Implement this helper
-        pass
-
-    def find_grade_by_id(grade_id):
-        """Find grade by ID."""
-        # TODO: Implement this helper
-        pass
-
-    def get_classes_for_school(school_id):
-        """Get all classes belonging to a school."""
-        # TODO: Return list of classes where class['school_id'] == school_id
-        pass
-
-    def get_students_for_class(class_id):
-        """Get all students in a class."""
-        # TODO: Return list of students where student['class_id'] == class_id
-        pass
-
-    def get_grades_for_student(student_id):
-        """Get all grades for a student."""
-        # TODO: Return list of grades where grade['student_id'] == student_id
-        pass
-
-    def update_class_student_count(class_id):
-        """Update student count for a class."""
-        # TODO: Count students in this class and update class['student_count']
-        # HINT: Find the class, count students with matching class_id
-        pass
-
-    def update_school_student_count(school_id):
-        """Update total student count for a school."""
-        # TODO: Count all students in all classes of this school
-        # HINT: Get all classes for school, then count students with matching school_id
-        pass
-
-    def validate_parent_child_relationship(school_id, class_id):
-        """
-        Validate that a class belongs to a school.
-
-        TODO: Implement relationship validation
-        STEPS:
-        1. Find the class by class_id
-        2. Check if class['school_id'] == school_id
-        3. Return True if match, False otherwise
-
-        WHY?: For nested endpoints like /schools/{school_id}/classes/{class_id}/students,
-        we need to verify the class actually belongs to that school.
-        """
-        # TODO: Implement validation
-        pass
-
-    # ============================================================================
-    # SCHOOLS ENDPOINTS
-    # ============================================================================
-
-    @schools_ns.route('/')
-    class SchoolList(Resource):
-        """Schools collection."""
-
-        @schools_ns.doc('list_schools')
-        @schools_ns.marshal_list_with(school_model)
-        def get(self):
-            """List all schools."""
-            # TODO: Return schools list
-            pass
-
-        @schools_ns.doc('create_school')
-        @schools_ns.expect(school_model)
-        @schools_ns.marshal_with(school_model, code=201)
-        def post(self):
-            """
-            Create a new school.
-
-            TODO: Implement school creation
-            STEPS:
-            1. Get request data
-            2. Validate required fields (name, address)
-            3. Generate new ID
-            4. Set student_count to 0
-            5. Add to schools list
-            6. Return school with 201
-            """
-            # TODO: Implement POST /schools
-            pass
-
-    @schools_ns.route('/<int:school_id>')
-    @schools_ns.param('school_id', 'School identifier')
-    class SchoolItem(Resource):
-        """Single school."""
-
-        @schools_ns.doc('get_school')
-        @schools_ns.marshal_with(school_model)
-        def get(self, school_id):
-            """Get school by ID."""
-            # TODO: Find school, return 404 if not found
-            pass
-
-        @schools_ns.doc('delete_school')
-        @schools_ns.response(204, 'School deleted')
-        def delete(self, school_id):
-            """
-            Delete school and cascade to classes and students.
-
-            TODO: Implement cascading delete
-            STEPS:
-            1. Find school (404 if not found)
-            2. Get all classes in this school
-            3. For each class, delete all students in that class
-            4. Delete all classes in this school
-            5. Delete the school
-            6. Return 204
-
-            CASCADING DELETE: When you delete a school, all related
-            classes and students should also be deleted.
-            """
-            # TODO: Implement DELETE /schools/{id} with cascade
-            pass
-
-    # ============================================================================
-    # CLASSES ENDPOINTS (Nested under Schools)
-    # ============================================================================
-
-    @schools_ns.route('/<int:school_id>/classes')
-    @schools_ns.param('school_id', 'School identifier')
-    class ClassList(Resource):
-        """Classes in a school."""
-
-        @schools_ns.doc('list_classes_in_school')
-        @schools_ns.marshal_list_with(class_model)
-        def get(self, school_id):
-            """
-            List all classes in a school.
-
-            TODO: Implement nested GET
-            STEPS:
-            1. Verify school exists (404 if not)
-            2. Get all classes for this school
-            3. Return classes list
-            """
-            # TODO: Implement GET /schools/{school_id}/classes
-            pass
-
-        @schools_ns.doc('create_class_in_school')
-        @schools_ns.expect(class_model)
-        @schools_ns.marshal_with(class_model, code=201)
-        def post(self, school_id):
-            """
-            Create a class in a school.
-
-            TODO: Implement nested POST
-            STEPS:
-            1. Verify school exists (404 if not) - PARENT VALIDATION
-            2. Get request data
-            3. Validate required fields (name, subject, teacher)
-            4. Generate new ID
-            5. Set school_id from URL parameter
-            6. Set student_count to 0
-            7. Add to classes list
-            8. Return class with 201
-
-            KEY CONCEPT: We automatically set school_id from the URL,
-            ensuring the class belongs to the correct school.
-            """
-            # TODO: Implement POST /schools/{school_id}/classes
-            pass
-
-    @schools_ns.route('/<int:school_id>/classes/<int:class_id>')
-    @schools_ns.param('school_id', 'School identifier')
-    @schools_ns.param('class_id', 'Class identifier')
-    class ClassItem(Resource):
-        """Single class in a school."""
-
-        @schools_ns.doc('get_class')
-        @schools_ns.marshal_with(class_model)
-        def get(self, school_id, class_id):
-            """
-            Get a specific class.
-
-            TODO: Implement nested GET with validation
-            STEPS:
-            1. Verify school exists (404 if not)
-            2. Find class (404 if not found)
-            3. Verify class belongs to school (404 if mismatch)
-            4. Return class
-
-            VALIDATION: We check that the class actually belongs to
-            the specified school, preventing access to /schools/1/classes/999
-            if class 999 belongs to school 2.
-            """
-            # TODO: Implement GET /schools/{school_id}/classes/{class_id}
-            pass
-
-        @schools_ns.doc('update_class')
-        @schools_ns.expect(class_model)
-        @schools_ns.marshal_with(class_model)
-        def put(self, school_id, class_id):
-            """
-            Update a class.
-
-            TODO: Implement nested PUT
-            HINT: Similar to GET but update fields
-            HINT: Validate parent-child relationship
-            """
-            # TODO: Implement PUT /schools/{school_id}/classes/{class_id}
-            pass
-
-        @schools_ns.doc('delete_class')
-        @schools_ns.response(204, 'Class deleted')
-        def delete(self, school_id, class_id):
-            """
-            Delete a class and its students.
-
-            TODO: Implement delete with cascade
-            STEPS:
-            1. Verify school exists
-            2. Find class and verify it belongs to school
-            3. Delete all students in this class
-            4. Delete the class
-            5. Update school's student count
-            6. Return 204
-            """
-            # TODO: Implement DELETE /schools/{school_id}/classes/{class_id}
-            pass
-
-    # ============================================================================
-    # STUDENTS ENDPOINTS (Nested under Classes)
-    # ============================================================================
-
-    @schools_ns.route('/<int:school_id>/classes/<int:class_id>/students')
-    @schools_ns.param('school_id', 'School identifier')
-    @schools_ns.param('class_id', 'Class identifier')
-    class StudentList(Resource):
-        """Students in a class."""
-
-        @schools_ns.doc('list_students_in_class')
-        @schools_ns.marshal_list_with(student_model)
-        def get(self, school_id, class_id):
-            """
-            List all students in a class.
-
-            TODO: Implement triple-nested GET
-            STEPS:
-            1. Verify school exists
-            2. Verify class exists and belongs to school
-            3. Get all students in this class
-            4. Return students list
-            """
-            # TODO: Implement GET /schools/{school_id}/classes/{class_id}/students
-            pass
-
-        @schools_ns.doc('create_student')
-        @schools_ns.expect(student_model)
-        @schools_ns.marshal_with(student_model, code=201)
-        def post(self, school_id, class_id):
-            """
-            Enroll a student in a class.
-
-            TODO: Implement triple-nested POST
-            STEPS:
-            1. Verify school exists
-            2. Verify class exists and belongs to school
-            3. Get request data
-            4. Validate required fields (name, email)
-            5. Generate new ID
-            6. Set school_id and class_id from URL
-            7. Set enrollment_date to today
-            8. Add to students list
-            9. Update class student count
-            10. Update school student count
-            11. Return student with 201
-            """
-            # TODO: Implement POST /schools/{school_id}/classes/{class_id}/students
-            pass
-
-    @schools_ns.route('/<int:school_id>/classes/<int:class_id>/students/<int:student_id>')
-    @schools_ns.param('school_id', 'School identifier')
-    @schools_ns.param('class_id', 'Class identifier')
-    @schools_ns.param('student_id', 'Student identifier')
-    class StudentItem(Resource):
-        """Single student."""
-
-        @schools_ns.doc('get_student')
-        @schools_ns.marshal_with(student_model)
-        def get(self, school_id, class_id, student_id):
-            """
-            Get a student.
-
-            TODO: Implement with full hierarchy validation
-            """
-            # TODO: Implement GET /schools/{school_id}/classes/{class_id}/students/{student_id}
-            pass
-
-        @schools_ns.doc('delete_student')
-        @schools_ns.response(204, 'Student deleted')
-        def delete(self, school_id, class_id, student_id):
-            """
-            Delete a student.
-
-            TODO: Implement delete with count updates
-            STEPS:
-            1. Validate hierarchy (school → class → student)
-            2. Delete student's grades
-            3. Delete student
-            4. Update class student count
-            5. Update school student count
-            6. Return 204
-            """
-            # TODO: Implement DELETE /schools/{school_id}/classes/{class_id}/students/{student_id}
-            pass
-
-    # ============================================================================
-    # GRADES ENDPOINTS (Nested under Students)
-    # ============================================================================
-
-    @schools_ns.route('/<int:school_id>/classes/<int:class_id>/students/<int:student_id>/grades')
-    @schools_ns.param('school_id', 'School identifier')
-    @schools_ns.param('class_id', 'Class identifier')
-    @schools_ns.param('student_id', 'Student identifier')
-    class GradeList(Resource):
-        """Grades for a student."""
-
-        @schools_ns.doc('list_student_grades')
-        @schools_ns.marshal_list_with(grade_model)
-        def get(self, school_id, class_id, student_id):
-            """
-            Get all grades for a student.
-
-            TODO: Implement 4-level nested GET
-            """
-            # TODO: Implement GET /schools/{school_id}/classes/{class_id}/students/{student_id}/grades
-            pass
-
-        @schools_ns.doc('create_grade')
-        @schools_ns.expect(grade_model)
-        @schools_ns.marshal_with(grade_model, code=201)
-        def post(self, school_id, class_id, student_id):
-            """
-            Add a grade for a student.
-
-            TODO: Implement 4-level nested POST
-            """
-            # TODO: Implement POST /schools/{school_id}/classes/{class_id}/students/{student_id}/grades
-            pass
-
-    # ============================================================================
-    # FLAT ALTERNATIVE ENDPOINTS (For convenience)
-    # ============================================================================
-
-    # Sometimes nested URLs are too long. Provide flat alternatives for common queries.
-
-    students_flat_ns = Namespace('students', description='Student operations (flat)')
-
-    @students_flat_ns.route('/<int:id>')
-    @students_flat_ns.param('id', 'Student identifier')
-    class StudentFlat(Resource):
-        """
-        Flat student endpoint (alternative to nested).
-
-        WHY?: /schools/1/classes/2/students/3 is very long.
-        Sometimes you just want /students/3
-        """
-
-        @students_flat_ns.doc('get_student_flat')
-        @students_flat_ns.marshal_with(student_model)
-        def get(self, id):
-            """
-            Get student by ID (flat endpoint).
-
-            TODO: Simply find and return student by ID
-            BENEFIT: Shorter URL when you already know the student ID
-            """
-            # TODO: Implement GET /students/{id}
-            pass
-
-    @students_flat_ns.route('/<int:id>/grades')
-    @students_flat_ns.param('id', 'Student identifier')
-    class StudentGradesFlat(Resource):
-        """Get grades without full hierarchy."""
-
-        @students_flat_ns.doc('get_student_grades_flat')
-        @students_flat_ns.marshal_list_with(grade_model)
-        def get(self, id):
-            """
-            Get all grades for a student (flat).
-
-            TODO: Verify student exists, then return grades
-            BENEFIT: /students/3/grades is much shorter than the nested version
-            """
-            # TODO: Implement GET /students/{id}/grades
-            pass
-
-    # ============================================================================
-    # REGISTER NAMESPACES
-    # ============================================================================
+    api.representations['application/json'] = output_json
 
     api.add_namespace(schools_ns, path='/schools')
     api.add_namespace(students_flat_ns, path='/students')
@@ -600,4 +947,11 @@ if __name__ == '__main__':
     print("\n🌐 Swagger UI: http://localhost:5000/swagger")
     print("="*70 + "\n")
 
-    app.run(debug=True, port=5000)
+    # Werkzeug's debug server (reloader + debugger on every request) is for
+    # development only; opt in with FLASK_DEBUG=1. Otherwise serve with
+    # waitress, a multi-threaded production WSGI server.
+    if os.getenv('FLASK_DEBUG') == '1':
+        app.run(debug=True, port=5000)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
@@ -30,16 +30,6 @@ BAD API ENDPOINTS (provided as reference):
 ❌ POST   /cancelOrderNow
 ❌ GET    /calculate_total?orderId=456
 
-TODO CHECKLIST:
-[ ] Identify resources (Users, Orders, etc.)
-[ ] Design RESTful URLs (nouns, not verbs)
-[ ] Use proper HTTP methods (GET, POST, PUT, PATCH, DELETE)
-[ ] Implement consistent response formats
-[ ] Apply proper nesting where appropriate
-[ ] Remove redundant endpoints
-[ ] Include calculated fields in responses
-[ ] Test in Swagger UI
-
 REST PRINCIPLES TO APPLY:
 1. Resource-Based URLs: Use nouns (/users), not verbs (/getUsers)
 2. HTTP Methods Define Actions: GET reads, POST creates, PUT/PATCH updates, DELETE removes
@@ -48,498 +38,871 @@ REST PRINCIPLES TO APPLY:
 5. Calculated Fields: Include in response, don't make separate endpoints
 """
 
-from flask import Flask
-from flask_restx import Api, Resource, fields, Namespace
+from flask import Flask, Response, request
+from flask.json.provider import JSONProvider
+from flask_restx import Api, Resource, fields, Namespace, Model
 from flask_cors import CORS
+from pydantic import BaseModel, ValidationError
 from datetime import datetime
-
-def create_app():
+from operator import itemgetter, mul
+import functools
+import itertools
+import math
+import orjson
+import os
+import threading
+
+# flask-restx deep-copies a model (Model.resolved) every time marshal_with or
+# marshal_list_with runs. Our models never change after they're declared,
+# so resolve each one once and reuse it.
+
+class StaticModel(Model):
+    """Model whose resolved copy is computed on first use and then cached."""
+
+    @functools.cached_property
+    def resolved(self):
+        return Model.resolved.fget(self)
+
+class StaticNamespace(Namespace):
+    """Namespace that registers StaticModels instead of plain Models."""
+
+    def model(self, name=None, model=None, mask=None, strict=False, **kwargs):
+        definition = StaticModel(name, model, mask=mask, strict=strict)
+        definition.__apidoc__.update(kwargs)
+        return self.add_model(name, definition)
+
+# Request body schemas. The flask-restx models document the API in Swagger;
+# these validate incoming payloads (pydantic-core does the work in Rust).
+# Unknown keys, such as read-only fields sent back from Swagger UI, are ignored.
+
+class UserIn(BaseModel):
+    name: str
+    email: str
+
+class UserUpdate(BaseModel):
+    name: str = None
+    email: str = None
+    active: bool = None
+
+class OrderItemIn(BaseModel):
+    product_name: str
+    quantity: int
+    price: float
+
+class OrderIn(BaseModel):
+    user_id: int
+    items: list[OrderItemIn]
+
+def parse_body(schema, ns):
     """
-    Create the refactored RESTful API.
+    Validate the JSON body against a pydantic schema, or abort with 400.
 
-    This API demonstrates proper REST design after refactoring.
+    The raw body is parsed and validated in a single pydantic-core pass
+    (model_validate_json), so no intermediate dict is built and the
+    Content-Type header isn't consulted. The error body matches
+    flask-restx's own payload validation:
+    ``{'message': 'Input payload validation failed', 'errors': {field: msg}}``.
     """
-    app = Flask(__name__)
-    CORS(app)
-
-    api = Api(
-        app,
-        version='5.0',
-        title='Refactored RESTful API',
-        description='Exercise 5: Apply RESTful Best Practices',
-        doc='/swagger'
-    )
-
-    # ============================================================================
-    # DATA MODELS
-    # ============================================================================
-
-    users_ns = Namespace('users', description='User operations')
-
-    user_model = users_ns.model('User', {
-        'id': fields.Integer(readonly=True, description='User ID'),
-        'name': fields.String(required=True, description='User name'),
-        'email': fields.String(required=True, description='User email'),
-        'active': fields.Boolean(description='User active status'),
-        'created_at': fields.String(description='Account creation date')
-    })
-
-    orders_ns = Namespace('orders', description='Order operations')
-
-    order_item_model = orders_ns.model('OrderItem', {
-        'product_name': fields.String(required=True),
-        'quantity': fields.Integer(required=True),
-        'price': fields.Float(required=True)
-    })
-
-    order_model = orders_ns.model('Order', {
-        'id': fields.Integer(readonly=True, description='Order ID'),
-        'user_id': fields.Integer(required=True, description='User ID'),
-        'items': fields.List(fields.Nested(order_item_model), required=True),
-        'status': fields.String(description='Order status'),
-        'total': fields.Float(readonly=True, description='Calculated total'),  # Calculated field!
-        'created_at': fields.String(description='Order creation date')
+    try:
+        return schema.model_validate_json(request.get_data(cache=False))
+    except ValidationError as e:
+        errors = {'.'.join(map(str, err['loc'])) or 'payload': err['msg'] for err in e.errors()}
+        ns.abort(400, 'Input payload validation failed', errors=errors)
+
+# Today's UTC date and its 'YYYY-MM-DD' string, reformatted only when the
+# date changes rather than on every POST
+_today_cache = {'d': None, 's': ''}
+
+def today_str():
+    """Return today's UTC date as 'YYYY-MM-DD', formatting it once per day."""
+    d = datetime.utcnow().date()
+    c = _today_cache
+    if c['d'] != d:
+        # Store the string before the date so a concurrent reader never
+        # pairs the new date with yesterday's string.
+        c['s'] = d.isoformat()
+        c['d'] = d
+    return c['s']
+
+# orjson parses and encodes JSON several times faster than the stdlib json
+# module that Flask and flask-restx use by default.
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider (jsonify, request.get_json) backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """flask-restx representation for application/json, encoded with orjson."""
+    return Response(orjson.dumps(data), status=code, headers=headers,
+                    mimetype='application/json')
+
+# Large collections can also be streamed as NDJSON (one JSON object per
+# line): clients start parsing immediately and the server never holds the
+# whole serialized list in memory.
+NDJSON = 'application/x-ndjson'
+
+# Users and orders change on every write, so caches may keep read responses
+# but must revalidate them each time: the ETag (see conditional_get) makes
+# that a cheap 304. 'private' keeps shared caches/CDNs from serving records
+# that were since updated or deleted.
+CACHE_HEADERS = {'Cache-Control': 'private, no-cache'}
+
+# List endpoints return one page at a time, so a request's work is bounded
+# by the page size rather than by the size of the collection.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+PAGE_PARAMS = {
+    'limit': f'Page size (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})',
+    'offset': 'Number of records to skip (default 0)'
+}
+
+def page_params():
+    """Read ?limit=&offset=, clamping limit to 1..MAX_PAGE_SIZE and offset to >= 0."""
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    return min(max(limit, 1), MAX_PAGE_SIZE), max(offset, 0)
+
+def paginate(rows, dump, limit, offset):
+    """Serialize one page of rows as {'data', 'next_offset', 'total'}."""
+    end = offset + limit
+    return {
+        'data': [dump(row) for row in rows[offset:end]],
+        'next_offset': end if end < len(rows) else None,
+        'total': len(rows)
+    }
+
+def wants_ndjson():
+    """True if the client's Accept header prefers NDJSON over JSON."""
+    return request.accept_mimetypes.best_match(['application/json', NDJSON]) == NDJSON
+
+def ndjson_response(rows, dump):
+    """Stream rows as NDJSON, serializing one record at a time."""
+    rows = list(rows)  # snapshot, so a concurrent write can't affect the stream
+
+    def generate():
+        for row in rows:
+            yield orjson.dumps(dump(row)) + b'\n'
+
+    return Response(generate(), mimetype=NDJSON, headers=CACHE_HEADERS)
+
+def compile_marshaller(model):
+    """
+    Generate a plain function that projects a stored dict onto a model.
+
+    marshal_with walks each field object for every record it returns; we
+    build the equivalent dict literal once instead and use it for every
+    response, single records and lists alike, e.g.
+    ``def _dump(o): return {'id': o.get('id'), 'name': o.get('name'), ...}``.
+    Values are passed through as stored, so handlers must store them in
+    their marshalled form.
+    """
+    src = 'def _dump(o): return {' + ', '.join(f'{k!r}: o.get({k!r})' for k in model) + '}'
+    namespace = {}
+    exec(src, namespace)
+    return namespace['_dump']
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+users_ns = StaticNamespace('users', description='User operations')
+
+user_model = users_ns.model('User', {
+    'id': fields.Integer(readonly=True, description='User ID'),
+    'name': fields.String(required=True, description='User name'),
+    'email': fields.String(required=True, description='User email'),
+    'active': fields.Boolean(description='User active status'),
+    'created_at': fields.String(description='Account creation date')
+})
+
+orders_ns = StaticNamespace('orders', description='Order operations')
+
+order_item_model = orders_ns.model('OrderItem', {
+    'product_name': fields.String(required=True),
+    'quantity': fields.Integer(required=True),
+    'price': fields.Float(required=True)
+})
+
+order_model = orders_ns.model('Order', {
+    'id': fields.Integer(readonly=True, description='Order ID'),
+    'user_id': fields.Integer(required=True, description='User ID'),
+    'items': fields.List(fields.Nested(order_item_model), required=True),
+    'status': fields.String(description='Order status'),
+    'total': fields.Float(readonly=True, description='Calculated total'),  # Calculated field!
+    'created_at': fields.String(description='Order creation date')
+})
+
+def page_model(ns, name, model):
+    """Swagger model for a page of `model` records, as built by paginate()."""
+    return ns.model(name, {
+        'data': fields.List(fields.Nested(model)),
+        'next_offset': fields.Integer(description='Offset of the next page, null on the last page'),
+        'total': fields.Integer(description='Total number of records')
     })
 
-    # ============================================================================
-    # IN-MEMORY DATA STORAGE
-    # ============================================================================
+user_page_model = page_model(users_ns, 'UserPage', user_model)
+order_page_model = page_model(orders_ns, 'OrderPage', order_model)
+
+dump_user = compile_marshaller(user_model)
+dump_order = compile_marshaller(order_model)
+
+# ============================================================================
+# IN-MEMORY DATA STORAGE
+# ============================================================================
+
+# Records are stored by id: lookups and deletes are O(1) dict operations,
+# and dicts keep insertion order for the list endpoints.
+users_by_id = {
+    1: {
+        'id': 1,
+        'name': 'John Doe',
+        'email': 'john@example.com',
+        'active': True,
+        'created_at': '2024-01-15'
+    },
+    2: {
+        'id': 2,
+        'name': 'Jane Smith',
+        'email': 'jane@example.com',
+        'active': True,
+        'created_at': '2024-02-01'
+    }
+}
+
+orders_by_id = {
+    1: {
+        'id': 1,
+        'user_id': 1,
+        'items': [
+            {'product_name': 'Laptop', 'quantity': 1, 'price': 999.99}
+        ],
+        'status': 'completed',
+        'created_at': '2024-03-01'
+    }
+}
+
+# Monotonic id allocators: O(1) per create instead of max() over the store,
+# and ids are never reused after a delete.
+next_user_id = itertools.count(max(users_by_id, default=0) + 1)
+next_order_id = itertools.count(max(orders_by_id, default=0) + 1)
+
+# user_id -> that user's orders, so /users/{id}/orders doesn't scan
+# every order in the system.
+orders_by_user = {}
+for o in orders_by_id.values():
+    orders_by_user.setdefault(o['user_id'], []).append(o)
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def find_user_by_id(user_id):
+    """Find user by ID."""
+    return users_by_id.get(user_id)
+
+def find_order_by_id(order_id):
+    """Find order by ID."""
+    return orders_by_id.get(order_id)
+
+def calculate_order_total(items):
+    """
+    Calculate total for an order.
 
-    users = [
-        {
-            'id': 1,
-            'name': 'John Doe',
-            'email': 'john@example.com',
-            'active': True,
-            'created_at': '2024-01-15'
-        },
-        {
-            'id': 2,
-            'name': 'Jane Smith',
-            'email': 'jane@example.com',
-            'active': True,
-            'created_at': '2024-02-01'
-        }
-    ]
-
-    orders = [
-        {
-            'id': 1,
-            'user_id': 1,
-            'items': [
-                {'product_name': 'Laptop', 'quantity': 1, 'price': 999.99}
-            ],
-            'status': 'completed',
-            'created_at': '2024-03-01'
-        }
-    ]
+    KEY CONCEPT: Calculated fields should be included in responses,
+    not exposed as separate endpoints like /calculate_total
 
-    # ============================================================================
-    # HELPER FUNCTIONS
-    # ============================================================================
+    The price*quantity products are summed by map/fsum in C, and fsum is
+    exactly rounded, so round(..., 2) sees no accumulated float drift.
+    """
+    prices = map(itemgetter('price'), items)
+    quantities = map(itemgetter('quantity'), items)
+    return round(math.fsum(map(mul, prices, quantities)), 2)
+
+def get_orders_for_user(user_id):
+    """Get all orders for a user."""
+    return orders_by_user.get(user_id, [])
+
+# Order items never change after creation, so the total is computed once
+# when the order is stored and read straight from the dict afterwards.
+for o in orders_by_id.values():
+    o['total'] = calculate_order_total(o['items'])
+
+# ETag support: each collection has a version that every write bumps,
+# and the written record is stamped with it ('_version' isn't in the
+# models, so it never reaches a response). Versions are never reused,
+# so an ETag can't match a different record that later gets the same id.
+versions = {'users': 0, 'orders': 0}
+for record in [*users_by_id.values(), *orders_by_id.values()]:
+    record['_version'] = 0
+
+# /users/search index: each user carries a casefolded copy of its name, and
+# name_trigrams maps every 3-character substring of those names to the ids
+# containing it. A query of 3+ characters only has to check the users that
+# share all of its trigrams. set_search_name() must run on every write to
+# 'name' and drop_search_name() on delete.
+name_trigrams = {}
+
+def trigrams(text):
+    """All 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def set_search_name(user):
+    """Index a user's casefolded name after it is created or changed."""
+    name_ci = user['name'].casefold()
+    if user.get('_name_ci') == name_ci:
+        return
+    if '_name_ci' in user:
+        drop_search_name(user)
+    user['_name_ci'] = name_ci
+    for gram in trigrams(name_ci):
+        name_trigrams.setdefault(gram, set()).add(user['id'])
+
+def drop_search_name(user):
+    """Remove a user's name from the trigram index."""
+    for gram in trigrams(user['_name_ci']):
+        ids = name_trigrams.get(gram)
+        if ids is not None:
+            ids.discard(user['id'])
+            if not ids:
+                del name_trigrams[gram]
+
+def search_users(term):
+    """Users whose name contains the casefolded term, oldest first."""
+    if len(term) < 3:
+        candidates = list(users_by_id.values())
+    else:
+        sets = sorted((name_trigrams.get(gram, set()) for gram in trigrams(term)), key=len)
+        ids = sets[0].intersection(*sets[1:])
+        # ids are allocated in increasing order, so sorting restores creation order
+        candidates = [users_by_id.get(i) for i in sorted(ids)]
+    return [u for u in candidates if u is not None and term in u['_name_ci']]
+
+for u in users_by_id.values():
+    set_search_name(u)
+
+# Encoded JSON bodies keyed by ETag. An ETag names one exact version of a
+# response, so a hit can be sent as-is; writes clear the cache so entries
+# for superseded versions don't pile up.
+_body_cache = {}
+
+def touch(collection, record=None):
+    """Bump a collection's version after a write and stamp the record."""
+    versions[collection] += 1
+    if record is not None:
+        record['_version'] = versions[collection]
+    _body_cache.clear()
+
+# Handlers can run concurrently under a threaded server. Every handler that
+# mutates the stores holds write_lock for its check-then-write, so ids,
+# indexes and versions stay consistent; readers never take it. They iterate
+# a list snapshot of the dict (one C-level copy, atomic under the GIL), and
+# search intersects sets in C, so a concurrent write can't disturb them.
+write_lock = threading.Lock()
+
+def conditional_get(etag, build):
+    """
+    Answer a GET with an ETag.
 
-    def find_user_by_id(user_id):
-        """Find user by ID."""
-        # TODO: Implement this helper
-        pass
+    If the client's If-None-Match already has this etag, return 304 with
+    no body. Otherwise send the cached encoded body for this etag, building
+    and serializing the payload only on the first request after a write.
+    """
+    headers = {'ETag': f'"{etag}"', **CACHE_HEADERS}
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    body = _body_cache.get(etag)
+    if body is None:
+        body = _body_cache[etag] = orjson.dumps(build())
+    return Response(body, headers=headers, mimetype='application/json')
+
+# ============================================================================
+# USERS ENDPOINTS - RESTful Design
+# ============================================================================
+
+@users_ns.route('/')
+class UserList(Resource):
+    """
+    Users collection endpoint.
 
-    def find_order_by_id(order_id):
-        """Find order by ID."""
-        # TODO: Implement this helper
-        pass
+    REFACTORED FROM:
+    ❌ GET /getAllUsers
+    ✅ GET /users
+    """
 
-    def calculate_order_total(items):
+    @users_ns.doc('list_users', params=PAGE_PARAMS)
+    @users_ns.response(200, 'Success', user_page_model)
+    def get(self):
         """
-        Calculate total for an order.
+        List all users.
 
-        TODO: Implement total calculation
-        HINT: sum(item['price'] * item['quantity'] for item in items)
-        HINT: Round to 2 decimal places
+        REFACTORING: Changed from /getAllUsers to /users
+        WHY: URLs should be resource-based (nouns), not action-based (verbs)
 
-        KEY CONCEPT: Calculated fields should be included in responses,
-        not exposed as separate endpoints like /calculate_total
+        OLD: GET /getAllUsers
+        NEW: GET /users
         """
-        # TODO: Implement calculation
-        pass
-
-    def get_orders_for_user(user_id):
-        """Get all orders for a user."""
-        # TODO: Return list of orders where order['user_id'] == user_id
-        pass
-
-    # ============================================================================
-    # USERS ENDPOINTS - RESTful Design
-    # ============================================================================
-
-    @users_ns.route('/')
-    class UserList(Resource):
+        limit, offset = page_params()
+        return conditional_get(f"users-{versions['users']}-{offset}-{limit}",
+                               lambda: paginate(list(users_by_id.values()), dump_user, limit, offset))
+
+    @users_ns.doc('create_user')
+    @users_ns.expect(user_model)
+    @users_ns.response(201, 'User created', user_model)
+    def post(self):
         """
-        Users collection endpoint.
+        Create a new user.
 
-        REFACTORED FROM:
-        ❌ GET /getAllUsers
-        ✅ GET /users
-        """
+        REFACTORING: Changed from /createUser to /users with POST method
 
-        @users_ns.doc('list_users')
-        @users_ns.marshal_list_with(user_model)
-        def get(self):
-            """
-            List all users.
-
-            TODO: Implement this endpoint
-            REFACTORING: Changed from /getAllUsers to /users
-            WHY: URLs should be resource-based (nouns), not action-based (verbs)
-
-            OLD: GET /getAllUsers
-            NEW: GET /users
-            """
-            # TODO: Return users list
-            pass
-
-        @users_ns.doc('create_user')
-        @users_ns.expect(user_model)
-        @users_ns.marshal_with(user_model, code=201)
-        def post(self):
-            """
-            Create a new user.
-
-            TODO: Implement user creation
-            REFACTORING: Changed from /createUser to /users with POST method
-
-            OLD: POST /createUser
-            NEW: POST /users
-
-            WHY: HTTP methods define the action, not the URL
-            """
-            # TODO: Implement POST /users
-            # STEPS:
-            # 1. Get request data
-            # 2. Validate required fields (name, email)
-            # 3. Generate new ID
-            # 4. Set active to True by default
-            # 5. Set created_at to today
-            # 6. Add to users list
-            # 7. Return user with 201
-            pass
-
-    @users_ns.route('/<int:id>')
-    @users_ns.param('id', 'User identifier')
-    class UserItem(Resource):
-        """
-        Single user endpoint.
+        OLD: POST /createUser
+        NEW: POST /users
 
-        REFACTORED FROM:
-        ❌ GET /getUserById?id=123
-        ✅ GET /users/123
+        WHY: HTTP methods define the action, not the URL
         """
+        data = parse_body(UserIn, users_ns)
 
-        @users_ns.doc('get_user')
-        @users_ns.marshal_with(user_model)
-        def get(self, id):
-            """
-            Get user by ID.
+        user = {
+            'id': next(next_user_id),
+            'name': data.name,
+            'email': data.email,
+            'active': True,
+            'created_at': today_str()
+        }
+        with write_lock:
+            set_search_name(user)
+            users_by_id[user['id']] = user
+            touch('users', user)
+        return dump_user(user), 201
+
+@users_ns.route('/<int:id>')
+@users_ns.param('id', 'User identifier')
+class UserItem(Resource):
+    """
+    Single user endpoint.
 
-            TODO: Implement this endpoint
-            REFACTORING: Changed from query parameter to path parameter
+    REFACTORED FROM:
+    ❌ GET /getUserById?id=123
+    ✅ GET /users/123
+    """
 
-            OLD: GET /getUserById?id=123
-            NEW: GET /users/123
+    @users_ns.doc('get_user')
+    @users_ns.response(200, 'Success', user_model)
+    def get(self, id):
+        """
+        Get user by ID.
 
-            WHY: Resource identifiers belong in the path, not query string
-            """
-            # TODO: Find user by ID, return 404 if not found
-            pass
+        REFACTORING: Changed from query parameter to path parameter
 
-        @users_ns.doc('update_user')
-        @users_ns.expect(user_model)
-        @users_ns.marshal_with(user_model)
-        def put(self, id):
-            """
-            Update user information.
+        OLD: GET /getUserById?id=123
+        NEW: GET /users/123
 
-            TODO: Implement user update
-            REFACTORING: Changed from POST to PUT method
+        WHY: Resource identifiers belong in the path, not query string
+        """
+        user = find_user_by_id(id)
+        if not user:
+            users_ns.abort(404, f'User {id} not found')
+        return conditional_get(f"user-{id}-{user['_version']}", lambda: dump_user(user))
+
+    @users_ns.doc('update_user')
+    @users_ns.expect(user_model)
+    @users_ns.response(200, 'Success', user_model)
+    def put(self, id):
+        """
+        Update user information.
 
-            OLD: POST /updateUserInfo
-            NEW: PUT /users/{id}
+        REFACTORING: Changed from POST to PUT method
 
-            WHY: PUT is the standard HTTP method for updates
-            """
-            # TODO: Implement PUT /users/{id}
-            pass
+        OLD: POST /updateUserInfo
+        NEW: PUT /users/{id}
 
-        @users_ns.doc('delete_user')
-        @users_ns.response(204, 'User deleted')
-        def delete(self, id):
-            """
-            Delete a user.
+        WHY: PUT is the standard HTTP method for updates
+        """
+        data = parse_body(UserUpdate, users_ns)
+        with write_lock:
+            user = find_user_by_id(id)
+            if not user:
+                users_ns.abort(404, f'User {id} not found')
+            user.update(data.model_dump(exclude_unset=True))
+            set_search_name(user)
+            touch('users', user)
+        return dump_user(user)
+
+    @users_ns.doc('delete_user')
+    @users_ns.response(204, 'User deleted')
+    def delete(self, id):
+        """
+        Delete a user.
 
-            TODO: Implement user deletion
-            REFACTORING: Changed from POST with query param to DELETE method
+        REFACTORING: Changed from POST with query param to DELETE method
 
-            OLD: POST /deleteUser?userId=123
-            NEW: DELETE /users/123
+        OLD: POST /deleteUser?userId=123
+        NEW: DELETE /users/123
 
-            WHY: DELETE is the idempotent method for removing resources
-            """
-            # TODO: Implement DELETE /users/{id}
-            pass
+        WHY: DELETE is the idempotent method for removing resources
 
-    @users_ns.route('/search')
-    class UserSearch(Resource):
+        The user's orders are deleted with them, so /orders never lists
+        orders whose user no longer exists.
         """
-        User search endpoint.
+        with write_lock:
+            user = users_by_id.pop(id, None)
+            if user is None:
+                users_ns.abort(404, f'User {id} not found')
+            drop_search_name(user)
+            orders = orders_by_user.pop(id, ())
+            for order in orders:
+                del orders_by_id[order['id']]
+            touch('users')
+            if orders:
+                touch('orders')
+        return '', 204
+
+@users_ns.route('/search')
+class UserSearch(Resource):
+    """
+    User search endpoint.
 
-        REFACTORED FROM:
-        ❌ GET /user_search?name=john
-        ✅ GET /users/search?name=john
+    REFACTORED FROM:
+    ❌ GET /user_search?name=john
+    ✅ GET /users/search?name=john
+    """
+
+    @users_ns.doc('search_users', params={'name': 'Search by name (partial match)'})
+    @users_ns.response(200, 'Success', [user_model])
+    def get(self):
         """
+        Search users by name.
 
-        @users_ns.doc('search_users', params={'name': 'Search by name (partial match)'})
-        @users_ns.marshal_list_with(user_model)
-        def get(self):
-            """
-            Search users by name.
+        REFACTORING: Moved under /users resource
 
-            TODO: Implement search
-            REFACTORING: Moved under /users resource
+        OLD: GET /user_search?name=john
+        NEW: GET /users/search?name=john
 
-            OLD: GET /user_search?name=john
-            NEW: GET /users/search?name=john
+        WHY: Search is an operation on users, should be under /users
+        ALTERNATIVE: Could also use GET /users?name=john (filtering)
 
-            WHY: Search is an operation on users, should be under /users
-            ALTERNATIVE: Could also use GET /users?name=john (filtering)
+        HINT: Get 'name' from request.args
+        HINT: Filter users where name contains the search term (case-insensitive)
+        """
+        term = request.args.get('name', '').casefold()
+        return [dump_user(u) for u in search_users(term)], 200, CACHE_HEADERS
 
-            HINT: Get 'name' from request.args
-            HINT: Filter users where name contains the search term (case-insensitive)
-            """
-            # TODO: Implement search
-            pass
+@users_ns.route('/<int:id>/activate')
+@users_ns.param('id', 'User identifier')
+class UserActivate(Resource):
+    """
+    User activation endpoint.
 
-    @users_ns.route('/<int:id>/activate')
-    @users_ns.param('id', 'User identifier')
-    class UserActivate(Resource):
-        """
-        User activation endpoint.
+    REFACTORED FROM:
+    ❌ POST /user_activate (with user_id in body)
+    ✅ PATCH /users/{id}/activate
+    """
 
-        REFACTORED FROM:
-        ❌ POST /user_activate (with user_id in body)
-        ✅ PATCH /users/{id}/activate
+    @users_ns.doc('activate_user')
+    @users_ns.response(200, 'Success', user_model)
+    def patch(self, id):
         """
+        Activate a user account.
 
-        @users_ns.doc('activate_user')
-        @users_ns.marshal_with(user_model)
-        def patch(self, id):
-            """
-            Activate a user account.
+        REFACTORING: Changed to PATCH on specific resource
 
-            TODO: Implement activation
-            REFACTORING: Changed to PATCH on specific resource
+        OLD: POST /user_activate
+        NEW: PATCH /users/{id}/activate
 
-            OLD: POST /user_activate
-            NEW: PATCH /users/{id}/activate
+        WHY: This is a partial update (changing active field), use PATCH
+        WHY: Resource ID should be in path, not body
 
-            WHY: This is a partial update (changing active field), use PATCH
-            WHY: Resource ID should be in path, not body
+        STEPS:
+        1. Find user (404 if not found)
+        2. Set active to True
+        3. Return updated user with 200
+        """
+        with write_lock:
+            user = find_user_by_id(id)
+            if not user:
+                users_ns.abort(404, f'User {id} not found')
+            user['active'] = True
+            touch('users', user)
+        return dump_user(user)
+
+@users_ns.route('/<int:id>/deactivate')
+@users_ns.param('id', 'User identifier')
+class UserDeactivate(Resource):
+    """
+    User deactivation endpoint.
 
-            STEPS:
-            1. Find user (404 if not found)
-            2. Set active to True
-            3. Return updated user with 200
-            """
-            # TODO: Implement PATCH /users/{id}/activate
-            pass
+    REFACTORED FROM:
+    ❌ POST /user_deactivate
+    ✅ PATCH /users/{id}/deactivate
+    """
 
-    @users_ns.route('/<int:id>/deactivate')
-    @users_ns.param('id', 'User identifier')
-    class UserDeactivate(Resource):
+    @users_ns.doc('deactivate_user')
+    @users_ns.response(200, 'Success', user_model)
+    def patch(self, id):
         """
-        User deactivation endpoint.
+        Deactivate a user account.
 
-        REFACTORED FROM:
-        ❌ POST /user_deactivate
-        ✅ PATCH /users/{id}/deactivate
+        HINT: Similar to activate, but set active to False
         """
+        with write_lock:
+            user = find_user_by_id(id)
+            if not user:
+                users_ns.abort(404, f'User {id} not found')
+            user['active'] = False
+            touch('users', user)
+        return dump_user(user)
+
+@users_ns.route('/<int:id>/orders')
+@users_ns.param('id', 'User identifier')
+class UserOrders(Resource):
+    """
+    User orders (nested resource).
 
-        @users_ns.doc('deactivate_user')
-        @users_ns.marshal_with(user_model)
-        def patch(self, id):
-            """
-            Deactivate a user account.
-
-            TODO: Implement deactivation
-            HINT: Similar to activate, but set active to False
-            """
-            # TODO: Implement PATCH /users/{id}/deactivate
-            pass
-
-    @users_ns.route('/<int:id>/orders')
-    @users_ns.param('id', 'User identifier')
-    class UserOrders(Resource):
-        """
-        User orders (nested resource).
+    REFACTORED FROM:
+    ❌ GET /fetchUserOrders?userId=123
+    ✅ GET /users/{id}/orders
+    """
 
-        REFACTORED FROM:
-        ❌ GET /fetchUserOrders?userId=123
-        ✅ GET /users/{id}/orders
+    @users_ns.doc('get_user_orders', params=PAGE_PARAMS)
+    @users_ns.response(200, 'Success', order_page_model)
+    @users_ns.produces(['application/json', NDJSON])
+    def get(self, id):
         """
+        Get all orders for a user.
 
-        @users_ns.doc('get_user_orders')
-        @users_ns.marshal_list_with(order_model)
-        def get(self, id):
-            """
-            Get all orders for a user.
+        REFACTORING: Changed to nested resource
 
-            TODO: Implement this endpoint
-            REFACTORING: Changed to nested resource
+        OLD: GET /fetchUserOrders?userId=123
+        NEW: GET /users/123/orders
 
-            OLD: GET /fetchUserOrders?userId=123
-            NEW: GET /users/123/orders
+        WHY: Orders belong to users, nesting shows this relationship clearly
+        WHY: No action verbs like "fetch" in URL
 
-            WHY: Orders belong to users, nesting shows this relationship clearly
-            WHY: No action verbs like "fetch" in URL
-
-            STEPS:
-            1. Verify user exists (404 if not)
-            2. Get all orders for this user
-            3. For each order, calculate and include total
-            4. Return orders list
-            """
-            # TODO: Implement GET /users/{id}/orders
-            pass
+        STEPS:
+        1. Verify user exists (404 if not)
+        2. Get all orders for this user
+        3. For each order, calculate and include total
+        4. Return orders list
+        """
+        if not find_user_by_id(id):
+            users_ns.abort(404, f'User {id} not found')
+        if wants_ndjson():
+            return ndjson_response(get_orders_for_user(id), dump_order)
+        limit, offset = page_params()
+        return conditional_get(f"user-{id}-orders-{versions['orders']}-{offset}-{limit}",
+                               lambda: paginate(get_orders_for_user(id), dump_order, limit, offset))
+
+@users_ns.route('/<int:id>/orders/stream')
+@users_ns.param('id', 'User identifier')
+class UserOrdersStream(Resource):
+    """User orders as NDJSON, for clients that can't set an Accept header."""
+
+    @users_ns.doc('stream_user_orders')
+    @users_ns.response(200, 'Success', [order_model])
+    @users_ns.produces([NDJSON])
+    def get(self, id):
+        """Stream all orders for a user, one JSON object per line."""
+        if not find_user_by_id(id):
+            users_ns.abort(404, f'User {id} not found')
+        return ndjson_response(get_orders_for_user(id), dump_order)
+
+# ============================================================================
+# ORDERS ENDPOINTS - RESTful Design
+# ============================================================================
+
+@orders_ns.route('/')
+class OrderList(Resource):
+    """
+    Orders collection.
 
-    # ============================================================================
-    # ORDERS ENDPOINTS - RESTful Design
-    # ============================================================================
+    REFACTORED FROM:
+    ❌ POST /placeNewOrder
+    ✅ POST /orders
+    """
 
-    @orders_ns.route('/')
-    class OrderList(Resource):
+    @orders_ns.doc('list_orders', params=PAGE_PARAMS)
+    @orders_ns.response(200, 'Success', order_page_model)
+    @orders_ns.produces(['application/json', NDJSON])
+    def get(self):
         """
-        Orders collection.
+        List all orders.
 
-        REFACTORED FROM:
-        ❌ POST /placeNewOrder
-        ✅ POST /orders
+        HINT: Include calculated total for each order
         """
-
-        @orders_ns.doc('list_orders')
-        @orders_ns.marshal_list_with(order_model)
-        def get(self):
-            """
-            List all orders.
-
-            TODO: Implement this endpoint
-            HINT: Include calculated total for each order
-            """
-            # TODO: Return all orders with totals
-            pass
-
-        @orders_ns.doc('create_order')
-        @orders_ns.expect(order_model)
-        @orders_ns.marshal_with(order_model, code=201)
-        def post(self):
-            """
-            Create a new order.
-
-            TODO: Implement order creation
-            REFACTORING: Changed from action-based to resource-based
-
-            OLD: POST /placeNewOrder
-            NEW: POST /orders
-
-            WHY: POST on a collection creates a new resource
-            WHY: No need for action verbs like "place" or "new"
-
-            STEPS:
-            1. Get request data
-            2. Validate required fields (user_id, items)
-            3. Verify user exists
-            4. Validate items list not empty
-            5. Generate new ID
-            6. Set status to 'pending'
-            7. Set created_at to today
-            8. Calculate and include total
-            9. Add to orders list
-            10. Return order with 201
-            """
-            # TODO: Implement POST /orders
-            pass
-
-    @orders_ns.route('/<int:id>')
-    @orders_ns.param('id', 'Order identifier')
-    class OrderItem(Resource):
+        if wants_ndjson():
+            return ndjson_response(orders_by_id.values(), dump_order)
+        limit, offset = page_params()
+        return conditional_get(f"orders-{versions['orders']}-{offset}-{limit}",
+                               lambda: paginate(list(orders_by_id.values()), dump_order, limit, offset))
+
+    @orders_ns.doc('create_order')
+    @orders_ns.expect(order_model)
+    @orders_ns.response(201, 'Order created', order_model)
+    def post(self):
         """
-        Single order endpoint.
-
-        REFACTORED FROM:
-        ❌ GET /getOrderStatus?orderId=456
-        ❌ GET /calculate_total?orderId=456
-        ✅ GET /orders/456
+        Create a new order.
+
+        REFACTORING: Changed from action-based to resource-based
+
+        OLD: POST /placeNewOrder
+        NEW: POST /orders
+
+        WHY: POST on a collection creates a new resource
+        WHY: No need for action verbs like "place" or "new"
+
+        STEPS:
+        1. Get request data
+        2. Validate required fields (user_id, items)
+        3. Verify user exists
+        4. Validate items list not empty
+        5. Generate new ID
+        6. Set status to 'pending'
+        7. Set created_at to today
+        8. Calculate and include total
+        9. Add to orders store
+        10. Return order with 201
         """
+        data = parse_body(OrderIn, orders_ns)
+        with write_lock:
+            # The user check shares the lock with the insert so the user
+            # can't be deleted in between
+            if not find_user_by_id(data.user_id):
+                orders_ns.abort(404, f'User {data.user_id} not found')
+            if not data.items:
+                orders_ns.abort(400, 'items must not be empty')
+
+            order = {
+                'id': next(next_order_id),
+                'user_id': data.user_id,
+                # Validated items already have exactly the OrderItem fields,
+                # so list endpoints can return them as-is
+                'items': [item.model_dump() for item in data.items],
+                'status': 'pending',
+                'created_at': today_str()
+            }
+            order['total'] = calculate_order_total(order['items'])
+            orders_by_id[order['id']] = order
+            orders_by_user.setdefault(order['user_id'], []).append(order)
+            touch('orders', order)
+        return dump_order(order), 201
+
+@orders_ns.route('/<int:id>')
+@orders_ns.param('id', 'Order identifier')
+class OrderItem(Resource):
+    """
+    Single order endpoint.
 
-        @orders_ns.doc('get_order')
-        @orders_ns.marshal_with(order_model)
-        def get(self, id):
-            """
-            Get order details including status and total.
+    REFACTORED FROM:
+    ❌ GET /getOrderStatus?orderId=456
+    ❌ GET /calculate_total?orderId=456
+    ✅ GET /orders/456
+    """
 
-            TODO: Implement this endpoint
-            REFACTORING: Consolidated multiple endpoints into one
+    @orders_ns.doc('get_order')
+    @orders_ns.response(200, 'Success', order_model)
+    def get(self, id):
+        """
+        Get order details including status and total.
 
-            OLD: GET /getOrderStatus?orderId=456
-            OLD: GET /calculate_total?orderId=456
-            NEW: GET /orders/456 (includes both status and total)
+        REFACTORING: Consolidated multiple endpoints into one
 
-            WHY: One resource = one endpoint
-            WHY: Calculated values should be included in response,
-                 not exposed as separate endpoints
+        OLD: GET /getOrderStatus?orderId=456
+        OLD: GET /calculate_total?orderId=456
+        NEW: GET /orders/456 (includes both status and total)
 
-            HINT: Include calculated total in response
-            """
-            # TODO: Find order, calculate total, return with 200
-            pass
+        WHY: One resource = one endpoint
+        WHY: Calculated values should be included in response,
+             not exposed as separate endpoints
 
-    @orders_ns.route('/<int:id>/cancel')
-    @orders_ns.param('id', 'Order identifier')
-    class OrderCancel(Resource):
+        HINT: Include calculated total in response
         """
-        Cancel order endpoint.
+        order = find_order_by_id(id)
+        if not order:
+            orders_ns.abort(404, f'Order {id} not found')
+        return conditional_get(f"order-{id}-{order['_version']}", lambda: dump_order(order))
+
+@orders_ns.route('/<int:id>/cancel')
+@orders_ns.param('id', 'Order identifier')
+class OrderCancel(Resource):
+    """
+    Cancel order endpoint.
 
-        REFACTORED FROM:
-        ❌ POST /cancelOrderNow
-        ✅ PATCH /orders/{id}/cancel
+    REFACTORED FROM:
+    ❌ POST /cancelOrderNow
+    ✅ PATCH /orders/{id}/cancel
+    """
+
+    @orders_ns.doc('cancel_order')
+    @orders_ns.response(200, 'Success', order_model)
+    def patch(self, id):
         """
+        Cancel an order.
+
+        REFACTORING: Changed to PATCH on specific resource
 
-        @orders_ns.doc('cancel_order')
-        @orders_ns.marshal_with(order_model)
-        def patch(self, id):
-            """
-            Cancel an order.
+        OLD: POST /cancelOrderNow
+        NEW: PATCH /orders/{id}/cancel
 
-            TODO: Implement order cancellation
-            REFACTORING: Changed to PATCH on specific resource
+        WHY: Cancellation is a partial update (changing status)
+        WHY: Use PATCH for partial updates
+        WHY: Resource ID in path, not body
 
-            OLD: POST /cancelOrderNow
-            NEW: PATCH /orders/{id}/cancel
+        STEPS:
+        1. Find order (404 if not found)
+        2. Check if already cancelled (400 if already cancelled)
+        3. Set status to 'cancelled'
+        4. Calculate and include total in response
+        5. Return updated order with 200
+        """
+        with write_lock:
+            order = find_order_by_id(id)
+            if not order:
+                orders_ns.abort(404, f'Order {id} not found')
+            if order['status'] == 'cancelled':
+                orders_ns.abort(400, f'Order {id} is already cancelled')
+            order['status'] = 'cancelled'
+            touch('orders', order)
+        return dump_order(order)
+
+# ============================================================================
+# APP FACTORY
+# ============================================================================
 
-            WHY: Cancellation is a partial update (changing status)
-            WHY: Use PATCH for partial updates
-            WHY: Resource ID in path, not body
+def create_app():
+    """
+    Create the refactored RESTful API.
 
-            STEPS:
-            1. Find order (404 if not found)
-            2. Check if already cancelled (400 if already cancelled)
-            3. Set status to 'cancelled'
-            4. Calculate and include total in response
-            5. Return updated order with 200
-            """
-            # TODO: Implement PATCH /orders/{id}/cancel
-            pass
+    This API demonstrates proper REST design after refactoring.
+    Namespaces, models, data and resources above are built once at import
+    time; the factory only wires them into a fresh Flask app.
+    """
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # CORS only for the API routes, from CORS_ORIGINS (comma-separated,
+    # default any origin); browsers may cache preflight results for a day.
+    origins = os.getenv('CORS_ORIGINS', '*').split(',')
+    CORS(app, resources={r'/users/*': {'origins': origins}, r'/orders/*': {'origins': origins}},
+         max_age=86400)
+
+    # Keep 404 bodies to the handler's message: the default help text runs a
+    # difflib match of the URL against every route on each miss.
+    app.config['RESTX_ERROR_404_HELP'] = False
+    # Serve /users and /users/ alike instead of answering one with a
+    # redirect the client has to follow (must be set before routes are added)
+    app.url_map.strict_slashes = False
 
-    # ============================================================================
-    # REGISTER NAMESPACES
-    # ============================================================================
+    api = Api(
+        app,
+        version='5.0',
+        title='Refactored RESTful API',
+        description='Exercise 5: Apply RESTful Best Practices',
+        doc='/swagger'
+    )
+    api.representations['application/json'] = output_json
 
     api.add_namespace(users_ns, path='/users')
     api.add_namespace(orders_ns, path='/orders')
@@ -577,11 +940,22 @@ if __name__ == '__main__':
     print("  4. Nested resources for relationships (/users/1/orders)")
     print("  5. Calculated fields in responses (total included in order)")
     print("  6. One resource = one endpoint (no separate /calculate_total)")
-    print("\n🎯 Your Task:")
-    print("  - Implement all TODO sections")
-    print("  - Notice how the new design is cleaner and more predictable")
+    print("\n🎯 Things to Notice:")
+    print("  - The new design is cleaner and more predictable")
     print("  - Compare old vs new endpoint structure")
     print("\n🌐 Swagger UI: http://localhost:5000/swagger")
     print("="*80 + "\n")
 
-    app.run(debug=True, port=5000)
+    # Werkzeug's debug server (reloader + debugger on every request) is for
+    # development only; opt in with FLASK_DEBUG=1. Otherwise serve with
+    # waitress, a multi-threaded production WSGI server that keeps client
+    # connections alive. Keep it to one process: the stores, id and version
+    # counters, search index and ETag body cache all live in this process's
+    # memory, so several workers would each hold different users and orders.
+    # Under gunicorn that means a single worker with threads:
+    #   gunicorn -w 1 -k gthread --threads 16 --keep-alive 30 'app:create_app()'
+    if os.getenv('FLASK_DEBUG') == '1':
+        app.run(debug=True, port=5000)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=16, connection_limit=1000)
@@ -42,20 +42,55 @@ audit_logs:
   - ip_address, created_at
 """
 
-from flask import Flask, request
+from flask import Flask, Response, request
 from flask_restx import Api, Resource, fields, Namespace
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from datetime import datetime
+import base64
+import binascii
 import os
-import json
+import orjson
 from dotenv import load_dotenv
-from sqlalchemy.orm import joinedload
-from sqlalchemy import Index
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy import DateTime, Index, exists, or_, select, text, tuple_, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import make_url
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 
 load_dotenv()
 
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, computed by the database.
+
+    PostgreSQL and SQLite get SQL that yields UTC regardless of the session
+    time zone; other dialects fall back to CURRENT_TIMESTAMP, which is only
+    UTC if the database session runs in UTC.
+
+    On SQLite it also matches the text format SQLAlchemy uses for datetimes
+    bound from Python (with microseconds), so comparisons such as the keyset
+    pagination cursor line up with stored values.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+@compiles(utcnow, 'sqlite')
+def _sqlite_utcnow(element, compiler, **kw):
+    return "(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"
+
 def create_app():
     app = Flask(__name__)
     CORS(app)
@@ -71,9 +106,38 @@ def create_app():
     app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Connection pool: each worker process keeps at most pool_size open
+    # connections (plus max_overflow during bursts), so several workers
+    # can't exhaust Postgres max_connections; pre_ping and recycle replace
+    # connections the server or a proxy has closed. Behind a transaction-mode
+    # pooler (PgBouncer, or Supabase's pooler on port 6543) set PGBOUNCER=1:
+    # the pooler already shares connections, so the app opens one per use.
+    # SQLite gets no pool sizing: in-memory databases use a single shared
+    # connection (StaticPool), which rejects pool_size/max_overflow.
+    backend = make_url(database_url).get_backend_name()
+    if os.getenv('PGBOUNCER') == '1':
+        engine_options = {'poolclass': NullPool}
+    elif backend == 'sqlite':
+        engine_options = {}
+    else:
+        engine_options = {'pool_pre_ping': True, 'pool_size': 5, 'max_overflow': 10, 'pool_recycle': 300}
+        if backend == 'postgresql':
+            # Cancel any statement running longer than 5s instead of letting
+            # it hold a connection (poolers may reject this startup option)
+            engine_options['connect_args'] = {'options': '-c statement_timeout=5000'}
+    # JSON columns are encoded and decoded with orjson
+    engine_options['json_serializer'] = lambda obj: orjson.dumps(obj).decode()
+    engine_options['json_deserializer'] = orjson.loads
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
     # Enable SQL logging for learning (disable in production)
     # app.config['SQLALCHEMY_ECHO'] = True
 
+    # List endpoints raise on any relationship they didn't eager-load instead
+    # of quietly running one query per row (N+1). SQLALCHEMY_RAISELOAD=0
+    # turns the guard off.
+    app.config['SQLALCHEMY_RAISELOAD'] = os.getenv('SQLALCHEMY_RAISELOAD', '1') == '1'
+
     # ============================================================================
     # API SETUP
     # ============================================================================
@@ -86,6 +150,16 @@ def create_app():
         doc='/swagger'
     )
 
+    # Endpoints return to_dict() as-is instead of using marshal_with /
+    # marshal_list_with: to_dict() already has the output model's fields, so
+    # marshalling would just rebuild every response field by field. Their
+    # @ns.response(...) decorators still document the shape in Swagger.
+    @api.representation('application/json')
+    def output_json(data, code, headers=None):
+        """Encode responses with orjson (C-speed, datetime-aware) instead of json."""
+        return Response(orjson.dumps(data), status=code, headers=headers,
+                        mimetype='application/json')
+
     # ============================================================================
     # DATABASE
     # ============================================================================
@@ -96,36 +170,135 @@ def create_app():
     # HELPER FUNCTIONS
     # ============================================================================
 
+    # List endpoints return one page at a time, newest first, with keyset
+    # (seek) pagination: the cursor is the (created_at, id) of the last row
+    # sent, and the next page is "WHERE (created_at, id) < cursor". Unlike
+    # OFFSET, the database seeks straight to the cursor in the created_at
+    # index instead of reading and discarding every earlier row.
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+    PAGE_PARAMS = {
+        'limit': f'Page size (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})',
+        'cursor': 'next_cursor from the previous page (omit for the first page)'
+    }
+
+    def page_args(ns):
+        """Read ?limit=&cursor=, clamping limit to 1..MAX_PAGE_SIZE. Aborts 400 on a bad cursor."""
+        limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+        after = None
+        if request.args.get('cursor'):
+            try:
+                created_at, id = base64.urlsafe_b64decode(request.args['cursor']).decode().split('|')
+                after = (datetime.fromisoformat(created_at), int(id))
+            except (binascii.Error, UnicodeDecodeError, ValueError):
+                ns.abort(400, 'Invalid cursor')
+        return min(max(limit, 1), MAX_PAGE_SIZE), after
+
+    def seek(query, model, limit, after):
+        """Apply keyset pagination to a Query or select(): one row past the page shows there's more."""
+        if after:
+            query = query.where(tuple_(model.created_at, model.id) < after)
+        return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+    def page(rows, limit):
+        """Wrap fetched rows (up to limit + 1 dicts) as {'data', 'next_cursor'}."""
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            created_at = last['created_at']
+            if isinstance(created_at, datetime):
+                created_at = created_at.isoformat()
+            next_cursor = base64.urlsafe_b64encode(f"{created_at}|{last['id']}".encode()).decode()
+        return {'data': rows[:limit], 'next_cursor': next_cursor}
+
+    def list_options(*eager):
+        """
+        Loader options for a query whose rows get serialized: the given
+        eager loads, plus raiseload('*') when SQLALCHEMY_RAISELOAD is on.
+        """
+        if app.config['SQLALCHEMY_RAISELOAD']:
+            return (*eager, raiseload('*'))
+        return eager
+
+    def post_rows(*criteria, limit, after, columns=None, include_author=False):
+        """
+        One page of live posts matching `criteria` as plain dicts (see seek).
+
+        Read with SQLAlchemy Core: rows come back as mappings, skipping ORM
+        object construction and identity-map bookkeeping, which dominate
+        large list reads. Timestamps stay datetimes; orjson writes them in
+        ISO format. With include_author, each post's author row is added
+        under 'author', fetched by one "WHERE users.id IN (...)" query so
+        an author with many posts is sent once.
+        """
+        if columns is None:
+            columns = Post.__table__.columns
+        stmt = seek(select(*columns).where(Post.deleted_at.is_(None), *criteria), Post, limit, after)
+        posts = [dict(row) for row in db.session.execute(stmt).mappings()]
+        if include_author and posts:
+            author_ids = {post['user_id'] for post in posts}
+            stmt = select(User.__table__).where(User.id.in_(author_ids))
+            authors = {row['id']: dict(row) for row in db.session.execute(stmt).mappings()}
+            for post in posts:
+                post['author'] = authors.get(post['user_id'])
+        return posts
+
     def log_audit(user_id, action, table_name, record_id, old_values=None, new_values=None):
         """
-        Create an audit log entry.
+        Add an audit log entry to the current transaction.
 
+        Call it before the handler's commit: the entry is written atomically
+        with the change it records, in the same single COMMIT.
         In a real app, user_id would come from authentication.
         """
-        try:
-            ip_address = request.remote_addr if request else None
-
-            audit = AuditLog(
-                user_id=user_id,
-                action=action,
-                table_name=table_name,
-                record_id=record_id,
-                old_values=json.dumps(old_values) if old_values else None,
-                new_values=json.dumps(new_values) if new_values else None,
-                ip_address=ip_address,
-                created_at=datetime.utcnow()
-            )
-            db.session.add(audit)
-            db.session.commit()
-        except Exception as e:
-            print(f"Audit logging failed: {e}")
-            # Don't fail the main operation if audit fails
-            db.session.rollback()
+        db.session.add(AuditLog(
+            user_id=user_id,
+            action=action,
+            table_name=table_name,
+            record_id=record_id,
+            old_values=old_values or None,
+            new_values=new_values or None,
+            ip_address=request.remote_addr if request else None
+        ))
+
+    def soft_delete(model, id):
+        """
+        Soft delete a live row with a single UPDATE ... RETURNING.
+
+        Returns the deleted row as a dict, or None if there is no live row
+        with that id - no SELECT beforehand and no ORM object to load.
+        """
+        return db.session.execute(
+            update(model).where(model.id == id, model.deleted_at.is_(None))
+                         .values(deleted_at=utcnow())
+                         .returning(*model.__table__.c),
+            execution_options={'synchronize_session': False}
+        ).mappings().first()
 
     # ============================================================================
     # MODELS
     # ============================================================================
 
+    def live_index(name, *columns):
+        """
+        Partial index over rows that aren't soft-deleted.
+
+        Queries filter on deleted_at IS NULL, so the index only needs live
+        rows: it stays smaller and the planner doesn't combine it with a
+        separate deleted_at index.
+        """
+        where = text('deleted_at IS NULL')
+        return Index(name, *columns, postgresql_where=where, sqlite_where=where)
+
+    # JSON documents: JSONB on PostgreSQL (plain JSON elsewhere), so values
+    # are stored parsed, come back as dicts without a json.loads, and can be
+    # queried by key (new_values @> '{"status": "published"}')
+    json_type = db.JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), 'postgresql')
+
+    # Timestamps are stamped by the database (see utcnow) in the INSERT or
+    # UPDATE statement itself, rather than built in Python and sent as bound
+    # parameters.
+
     class Organization(db.Model):
         """
         Organization model representing a tenant.
@@ -142,8 +315,8 @@ def create_app():
         slug = db.Column(db.String(50), unique=True, nullable=False, index=True)
         plan = db.Column(db.String(20), default='free', index=True)  # free, pro, enterprise
         is_active = db.Column(db.Boolean, default=True, index=True)
-        created_at = db.Column(db.DateTime, default=datetime.utcnow)
-        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+        created_at = db.Column(db.DateTime, server_default=utcnow())
+        updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
         deleted_at = db.Column(db.DateTime, nullable=True, index=True)
 
         # Relationships
@@ -176,7 +349,7 @@ def create_app():
         - username: Unique constraint + fast lookups
         - email: Unique constraint + fast lookups
         - organization_id: Fast filtering by org
-        - (organization_id, is_active): Fast queries for active users in org
+        - (organization_id, is_active) where not deleted: Fast queries for live users in org
         """
         __tablename__ = 'users'
 
@@ -186,16 +359,16 @@ def create_app():
         full_name = db.Column(db.String(100), nullable=True)
         is_active = db.Column(db.Boolean, default=True, index=True)
         organization_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), nullable=False, index=True)
-        created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-        deleted_at = db.Column(db.DateTime, nullable=True, index=True)
+        created_at = db.Column(db.DateTime, server_default=utcnow(), index=True)
+        updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
+        deleted_at = db.Column(db.DateTime, nullable=True)
 
         # Relationships
         posts = db.relationship('Post', backref='author', lazy=True, cascade='all, delete-orphan')
 
         # Composite index
         __table_args__ = (
-            Index('idx_user_org_active', 'organization_id', 'is_active'),
+            live_index('idx_user_org_active_live', 'organization_id', 'is_active'),
         )
 
         def to_dict(self, include_organization=False):
@@ -222,9 +395,8 @@ def create_app():
         Indexes:
         - user_id: Fast filtering by author
         - organization_id: Fast filtering by org
-        - status: Fast filtering by status
-        - (organization_id, status): Fast queries for published posts in org
-        - (organization_id, created_at): Fast queries for recent posts in org
+        - (organization_id, status) where not deleted: Fast queries for published posts in org
+        - (organization_id, created_at) where not deleted: Fast queries for recent posts in org
         """
         __tablename__ = 'posts'
 
@@ -233,16 +405,16 @@ def create_app():
         organization_id = db.Column(db.Integer, db.ForeignKey('organizations.id'), nullable=False, index=True)
         title = db.Column(db.String(200), nullable=False)
         content = db.Column(db.Text, nullable=True)
-        status = db.Column(db.String(20), default='draft', index=True)  # draft, published, archived
+        status = db.Column(db.String(20), default='draft')  # draft, published, archived
         view_count = db.Column(db.Integer, default=0)
-        created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-        updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-        deleted_at = db.Column(db.DateTime, nullable=True, index=True)
+        created_at = db.Column(db.DateTime, server_default=utcnow(), index=True)
+        updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
+        deleted_at = db.Column(db.DateTime, nullable=True)
 
-        # Composite indexes
+        # Composite indexes (partial: live posts only)
         __table_args__ = (
-            Index('idx_post_org_status', 'organization_id', 'status'),
-            Index('idx_post_org_created', 'organization_id', 'created_at'),
+            live_index('idx_post_org_status_live', 'organization_id', 'status'),
+            live_index('idx_post_org_created_live', 'organization_id', 'created_at'),
         )
 
         def to_dict(self, include_author=False, include_organization=False):
@@ -271,25 +443,31 @@ def create_app():
 
         Indexes:
         - action: Fast filtering by action type
-        - table_name: Fast filtering by table
         - record_id: Fast filtering by record
-        - (table_name, record_id): Fast queries for specific record history
+        - created_at: Newest-first listing without filters
+        - (table_name, record_id, created_at): Record history, already sorted
+        - (table_name, action, created_at): Per-table action feed, already sorted
+
+        The composites end in created_at so the newest-first LIMIT 100 of
+        the audit endpoint is an index scan that stops early, not a sort.
+        table_name needs no index of its own: it leads both composites.
         """
         __tablename__ = 'audit_logs'
 
         id = db.Column(db.Integer, primary_key=True)
         user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
         action = db.Column(db.String(50), nullable=False, index=True)  # create, update, delete
-        table_name = db.Column(db.String(50), nullable=False, index=True)
+        table_name = db.Column(db.String(50), nullable=False)
         record_id = db.Column(db.Integer, nullable=False, index=True)
-        old_values = db.Column(db.Text, nullable=True)  # JSON string
-        new_values = db.Column(db.Text, nullable=True)  # JSON string
+        old_values = db.Column(json_type, nullable=True)
+        new_values = db.Column(json_type, nullable=True)
         ip_address = db.Column(db.String(45), nullable=True)
-        created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+        created_at = db.Column(db.DateTime, server_default=utcnow(), index=True)
 
-        # Composite index
+        # Composite indexes (filter columns first, sort column last)
         __table_args__ = (
-            Index('idx_audit_table_record', 'table_name', 'record_id'),
+            Index('idx_audit_table_record_created', 'table_name', 'record_id', 'created_at'),
+            Index('idx_audit_table_action_created', 'table_name', 'action', 'created_at'),
         )
 
         def to_dict(self):
@@ -299,8 +477,8 @@ def create_app():
                 'action': self.action,
                 'table_name': self.table_name,
                 'record_id': self.record_id,
-                'old_values': json.loads(self.old_values) if self.old_values else None,
-                'new_values': json.loads(self.new_values) if self.new_values else None,
+                'old_values': self.old_values,
+                'new_values': self.new_values,
                 'ip_address': self.ip_address,
                 'created_at': self.created_at.isoformat() if self.created_at else None
             }
@@ -398,33 +576,43 @@ def create_app():
         'created_at': fields.String(description='Timestamp')
     })
 
+    def page_model(ns, name, model):
+        """Swagger model for a page of `model` records, as built by page()."""
+        return ns.model(name, {
+            'data': fields.List(fields.Nested(model)),
+            'next_cursor': fields.String(description='Cursor for the next page, null on the last page')
+        })
+
+    org_page_model = page_model(orgs_ns, 'OrganizationPage', org_output_model)
+    user_page_model = page_model(users_ns, 'UserPage', user_output_model)
+    post_page_model = page_model(posts_ns, 'PostPage', post_output_model)
+
     # ============================================================================
     # ORGANIZATION ENDPOINTS
     # ============================================================================
 
     @orgs_ns.route('/')
     class OrganizationList(Resource):
-        @orgs_ns.doc('list_organizations')
-        @orgs_ns.marshal_list_with(org_output_model)
+        @orgs_ns.doc('list_organizations', params=PAGE_PARAMS)
+        @orgs_ns.response(200, 'Success', org_page_model)
         def get(self):
-            """List all active organizations"""
-            orgs = Organization.query.filter(Organization.deleted_at.is_(None)).all()
-            return [org.to_dict() for org in orgs]
+            """List active organizations, newest first"""
+            limit, after = page_args(orgs_ns)
+            query = Organization.query.filter(Organization.deleted_at.is_(None))\
+                                      .options(*list_options())
+            orgs = seek(query, Organization, limit, after).all()
+            return page([org.to_dict() for org in orgs], limit)
 
         @orgs_ns.doc('create_organization')
         @orgs_ns.expect(org_input_model)
-        @orgs_ns.marshal_with(org_output_model, code=201)
+        @orgs_ns.response(201, 'Created', org_output_model)
         @orgs_ns.response(409, 'Organization already exists')
         def post(self):
             """Create a new organization"""
             data = request.json
 
-            # Check for duplicates
-            if Organization.query.filter_by(name=data['name']).first():
-                return {'message': 'Organization with this name already exists'}, 409
-            if Organization.query.filter_by(slug=data['slug']).first():
-                return {'message': 'Organization with this slug already exists'}, 409
-
+            # Insert first and let the unique constraints catch duplicates: the
+            # common (non-duplicate) path costs no SELECT at all
             try:
                 org = Organization(
                     name=data['name'],
@@ -433,21 +621,33 @@ def create_app():
                     is_active=data.get('is_active', True)
                 )
                 db.session.add(org)
-                db.session.commit()
+                db.session.flush()  # assigns org.id
 
-                # Audit log
-                log_audit(None, 'create', 'organizations', org.id, new_values=org.to_dict())
+                # Audit log, committed together with the organization
+                result = org.to_dict()
+                log_audit(None, 'create', 'organizations', org.id, new_values=result)
+                db.session.commit()
 
-                return org.to_dict(), 201
+                return result, 201
             except IntegrityError:
                 db.session.rollback()
-                return {'message': 'Database integrity error'}, 409
+
+            # Only a rejected insert pays for the lookup that picks the message
+            clashes = db.session.query(Organization.name, Organization.slug)\
+                                .filter(or_(Organization.name == data['name'],
+                                            Organization.slug == data['slug']))\
+                                .all()
+            if any(name == data['name'] for name, _ in clashes):
+                return {'message': 'Organization with this name already exists'}, 409
+            if clashes:
+                return {'message': 'Organization with this slug already exists'}, 409
+            return {'message': 'Database integrity error'}, 409
 
     @orgs_ns.route('/<int:id>')
     @orgs_ns.param('id', 'Organization identifier')
     class OrganizationItem(Resource):
         @orgs_ns.doc('get_organization')
-        @orgs_ns.marshal_with(org_output_model)
+        @orgs_ns.response(200, 'Success', org_output_model)
         @orgs_ns.response(404, 'Organization not found')
         def get(self, id):
             """Get organization by ID"""
@@ -461,42 +661,44 @@ def create_app():
         @orgs_ns.response(404, 'Organization not found')
         def delete(self, id):
             """Soft delete organization"""
-            org = Organization.query.get_or_404(id)
-            if org.deleted_at:
+            row = soft_delete(Organization, id)
+            if row is None:
                 return {'message': 'Organization not found'}, 404
 
-            old_values = org.to_dict()
-            org.deleted_at = datetime.utcnow()
+            log_audit(None, 'delete', 'organizations', id,
+                      old_values={'deleted_at': None}, new_values=dict(row))
             db.session.commit()
-
-            log_audit(None, 'delete', 'organizations', id, old_values=old_values)
             return '', 204
 
     @orgs_ns.route('/<int:id>/users')
     @orgs_ns.param('id', 'Organization identifier')
     class OrganizationUsers(Resource):
-        @orgs_ns.doc('get_organization_users')
-        @orgs_ns.marshal_list_with(user_output_model)
+        @orgs_ns.doc('get_organization_users', params=PAGE_PARAMS)
+        @orgs_ns.response(200, 'Success', user_page_model)
         def get(self, id):
-            """Get all users in organization"""
-            org = Organization.query.get_or_404(id)
-            users = User.query.filter_by(organization_id=id).filter(User.deleted_at.is_(None)).all()
-            return [user.to_dict() for user in users]
+            """Get users in organization, newest first"""
+            limit, after = page_args(orgs_ns)
+            query = User.query.filter_by(organization_id=id).filter(User.deleted_at.is_(None))\
+                              .options(*list_options())
+            users = seek(query, User, limit, after).all()
+            if not users:
+                # Rows prove the parent exists; only an empty page needs the 404 check
+                Organization.query.get_or_404(id)
+            return page([user.to_dict() for user in users], limit)
 
     @orgs_ns.route('/<int:id>/posts')
     @orgs_ns.param('id', 'Organization identifier')
     class OrganizationPosts(Resource):
-        @orgs_ns.doc('get_organization_posts')
-        @orgs_ns.marshal_list_with(post_output_model)
+        @orgs_ns.doc('get_organization_posts', params=PAGE_PARAMS)
+        @orgs_ns.response(200, 'Success', post_page_model)
         def get(self, id):
-            """Get all posts in organization (with eager loaded authors)"""
-            org = Organization.query.get_or_404(id)
-            # Use eager loading to prevent N+1 queries
-            posts = Post.query.filter_by(organization_id=id)\
-                              .filter(Post.deleted_at.is_(None))\
-                              .options(joinedload(Post.author))\
-                              .all()
-            return [post.to_dict(include_author=True) for post in posts]
+            """Get posts in organization, newest first (with eager loaded authors)"""
+            limit, after = page_args(orgs_ns)
+            # Authors come in one batched query, not one per post (no N+1)
+            posts = post_rows(Post.organization_id == id, limit=limit, after=after, include_author=True)
+            if not posts:
+                Organization.query.get_or_404(id)
+            return page(posts, limit)
 
     # ============================================================================
     # USER ENDPOINTS
@@ -504,16 +706,19 @@ def create_app():
 
     @users_ns.route('/')
     class UserList(Resource):
-        @users_ns.doc('list_users')
-        @users_ns.marshal_list_with(user_output_model)
+        @users_ns.doc('list_users', params=PAGE_PARAMS)
+        @users_ns.response(200, 'Success', user_page_model)
         def get(self):
-            """List all active users"""
-            users = User.query.filter(User.deleted_at.is_(None)).all()
-            return [user.to_dict() for user in users]
+            """List active users, newest first"""
+            limit, after = page_args(users_ns)
+            query = User.query.filter(User.deleted_at.is_(None))\
+                              .options(*list_options())
+            users = seek(query, User, limit, after).all()
+            return page([user.to_dict() for user in users], limit)
 
         @users_ns.doc('create_user')
         @users_ns.expect(user_input_model)
-        @users_ns.marshal_with(user_output_model, code=201)
+        @users_ns.response(201, 'Created', user_output_model)
         @users_ns.response(400, 'Validation Error')
         @users_ns.response(404, 'Organization not found')
         @users_ns.response(409, 'User already exists')
@@ -521,15 +726,19 @@ def create_app():
             """Create a new user"""
             data = request.json
 
-            # Validate organization exists
-            org = Organization.query.get(data['organization_id'])
-            if not org or org.deleted_at:
+            # Validate organization exists and check for duplicates in one
+            # round-trip: no row means no such organization
+            row = db.session.query(
+                Organization.deleted_at,
+                exists().where(User.username == data['username']),
+                exists().where(User.email == data['email'])
+            ).filter(Organization.id == data['organization_id']).first()
+            if not row or row[0]:
                 return {'message': 'Organization not found'}, 404
-
-            # Check for duplicates
-            if User.query.filter_by(username=data['username']).first():
+            _, username_taken, email_taken = row
+            if username_taken:
                 return {'message': 'Username already exists'}, 409
-            if User.query.filter_by(email=data['email']).first():
+            if email_taken:
                 return {'message': 'Email already exists'}, 409
 
             try:
@@ -541,10 +750,12 @@ def create_app():
                     is_active=data.get('is_active', True)
                 )
                 db.session.add(user)
-                db.session.commit()
+                db.session.flush()  # assigns user.id
 
-                log_audit(None, 'create', 'users', user.id, new_values=user.to_dict())
-                return user.to_dict(), 201
+                result = user.to_dict()
+                log_audit(None, 'create', 'users', user.id, new_values=result)
+                db.session.commit()
+                return result, 201
             except IntegrityError:
                 db.session.rollback()
                 return {'message': 'Database integrity error'}, 409
@@ -553,7 +764,7 @@ def create_app():
     @users_ns.param('id', 'User identifier')
     class UserItem(Resource):
         @users_ns.doc('get_user')
-        @users_ns.marshal_with(user_output_model)
+        @users_ns.response(200, 'Success', user_output_model)
         @users_ns.response(404, 'User not found')
         def get(self, id):
             """Get user by ID"""
@@ -564,7 +775,7 @@ def create_app():
 
         @users_ns.doc('update_user')
         @users_ns.expect(user_input_model)
-        @users_ns.marshal_with(user_output_model)
+        @users_ns.response(200, 'Success', user_output_model)
         @users_ns.response(404, 'User not found')
         @users_ns.response(409, 'Duplicate username/email')
         def put(self, id):
@@ -576,17 +787,9 @@ def create_app():
             data = request.json
             old_values = user.to_dict()
 
-            # Check for duplicates (excluding current user)
             if 'username' in data:
-                existing = User.query.filter_by(username=data['username']).first()
-                if existing and existing.id != id:
-                    return {'message': 'Username already exists'}, 409
                 user.username = data['username']
-
             if 'email' in data:
-                existing = User.query.filter_by(email=data['email']).first()
-                if existing and existing.id != id:
-                    return {'message': 'Email already exists'}, 409
                 user.email = data['email']
 
             if 'full_name' in data:
@@ -594,32 +797,48 @@ def create_app():
             if 'is_active' in data:
                 user.is_active = data['is_active']
 
-            db.session.commit()
+            # Let the unique constraints reject duplicates; only a rejected
+            # update pays for the lookup (excluding this user) behind the 409
+            try:
+                db.session.flush()  # applies the update, so new_values has updated_at
+            except IntegrityError:
+                db.session.rollback()
+                unique = [column == data[column.key] for column in (User.username, User.email)
+                          if column.key in data]
+                if unique:
+                    clashes = db.session.query(User.username, User.email)\
+                                        .filter(User.id != id, or_(*unique))\
+                                        .all()
+                    if 'username' in data and any(u == data['username'] for u, _ in clashes):
+                        return {'message': 'Username already exists'}, 409
+                    if clashes:
+                        return {'message': 'Email already exists'}, 409
+                return {'message': 'Database integrity error'}, 409
 
-            log_audit(None, 'update', 'users', id, old_values=old_values, new_values=user.to_dict())
-            return user.to_dict()
+            result = user.to_dict()
+            log_audit(None, 'update', 'users', id, old_values=old_values, new_values=result)
+            db.session.commit()
+            return result
 
         @users_ns.doc('delete_user')
         @users_ns.response(204, 'User deleted')
         @users_ns.response(404, 'User not found')
         def delete(self, id):
             """Soft delete user"""
-            user = User.query.get_or_404(id)
-            if user.deleted_at:
+            row = soft_delete(User, id)
+            if row is None:
                 return {'message': 'User not found'}, 404
 
-            old_values = user.to_dict()
-            user.deleted_at = datetime.utcnow()
+            log_audit(None, 'delete', 'users', id,
+                      old_values={'deleted_at': None}, new_values=dict(row))
             db.session.commit()
-
-            log_audit(None, 'delete', 'users', id, old_values=old_values)
             return '', 204
 
     @users_ns.route('/<int:id>/restore')
     @users_ns.param('id', 'User identifier')
     class UserRestore(Resource):
         @users_ns.doc('restore_user')
-        @users_ns.marshal_with(user_output_model)
+        @users_ns.response(200, 'Success', user_output_model)
         @users_ns.response(404, 'User not found or not deleted')
         def post(self, id):
             """Restore soft-deleted user"""
@@ -628,21 +847,25 @@ def create_app():
                 return {'message': 'User is not deleted'}, 404
 
             user.deleted_at = None
-            db.session.commit()
+            db.session.flush()
 
-            log_audit(None, 'restore', 'users', id, new_values=user.to_dict())
-            return user.to_dict()
+            result = user.to_dict()
+            log_audit(None, 'restore', 'users', id, new_values=result)
+            db.session.commit()
+            return result
 
     @users_ns.route('/<int:id>/posts')
     @users_ns.param('id', 'User identifier')
     class UserPosts(Resource):
-        @users_ns.doc('get_user_posts')
-        @users_ns.marshal_list_with(post_output_model)
+        @users_ns.doc('get_user_posts', params=PAGE_PARAMS)
+        @users_ns.response(200, 'Success', post_page_model)
         def get(self, id):
-            """Get all posts by user"""
-            user = User.query.get_or_404(id)
-            posts = Post.query.filter_by(user_id=id).filter(Post.deleted_at.is_(None)).all()
-            return [post.to_dict() for post in posts]
+            """Get posts by user, newest first"""
+            limit, after = page_args(users_ns)
+            posts = post_rows(Post.user_id == id, limit=limit, after=after)
+            if not posts:
+                User.query.get_or_404(id)
+            return page(posts, limit)
 
     # ============================================================================
     # POST ENDPOINTS
@@ -650,35 +873,53 @@ def create_app():
 
     @posts_ns.route('/')
     class PostList(Resource):
-        @posts_ns.doc('list_posts')
-        @posts_ns.marshal_list_with(post_output_model)
+        @posts_ns.doc('list_posts', params=PAGE_PARAMS)
+        @posts_ns.response(200, 'Success', post_page_model)
+        @posts_ns.param('fields', 'Comma-separated columns to load, e.g. title,status (default: all)')
         def get(self):
-            """List all active posts (with eager loaded authors - no N+1!)"""
-            posts = Post.query.filter(Post.deleted_at.is_(None))\
-                              .options(joinedload(Post.author))\
-                              .all()
-            return [post.to_dict(include_author=True) for post in posts]
+            """List active posts, newest first (with eager loaded authors - no N+1!)"""
+            limit, after = page_args(posts_ns)
+
+            # Column projection: only SELECT the requested columns, so a list
+            # view can skip wide ones like content
+            columns = None
+            if 'fields' in request.args:
+                names = [name for name in request.args['fields'].split(',') if name]
+                unknown = set(names) - set(Post.__table__.columns.keys())
+                if unknown:
+                    posts_ns.abort(400, f"Unknown fields: {', '.join(sorted(unknown))}")
+                # Always included: id and created_at make up the page cursor,
+                # user_id finds the author
+                always = ('id', 'user_id', 'created_at')
+                columns = [Post.id, Post.user_id, Post.created_at,
+                           *(getattr(Post, name) for name in names if name not in always)]
+
+            posts = post_rows(limit=limit, after=after, columns=columns, include_author=True)
+            return page(posts, limit)
 
         @posts_ns.doc('create_post')
         @posts_ns.expect(post_input_model)
-        @posts_ns.marshal_with(post_output_model, code=201)
+        @posts_ns.response(201, 'Created', post_output_model)
         @posts_ns.response(404, 'User or organization not found')
         def post(self):
             """Create a new post"""
             data = request.json
 
-            # Validate user exists
-            user = User.query.get(data['user_id'])
-            if not user or user.deleted_at:
+            # Validate user, organization and membership in one round-trip:
+            # no row means no such user, a null organization id no such org
+            row = db.session.query(User.deleted_at, User.organization_id,
+                                   Organization.id, Organization.deleted_at)\
+                            .outerjoin(Organization, Organization.id == data['organization_id'])\
+                            .filter(User.id == data['user_id'])\
+                            .first()
+            if not row or row[0]:
                 return {'message': 'User not found'}, 404
-
-            # Validate organization exists
-            org = Organization.query.get(data['organization_id'])
-            if not org or org.deleted_at:
+            _, user_org_id, org_id, org_deleted_at = row
+            if org_id is None or org_deleted_at:
                 return {'message': 'Organization not found'}, 404
 
             # Validate user belongs to organization
-            if user.organization_id != data['organization_id']:
+            if user_org_id != data['organization_id']:
                 return {'message': 'User does not belong to this organization'}, 400
 
             post = Post(
@@ -689,36 +930,51 @@ def create_app():
                 status=data.get('status', 'draft')
             )
             db.session.add(post)
-            db.session.commit()
+            db.session.flush()  # assigns post.id
 
+            # Serialize before commit, which would expire the post and make
+            # to_dict() reload it and lazy-load its author all over again
+            result = post.to_dict(include_author=True)
             log_audit(data['user_id'], 'create', 'posts', post.id, new_values=post.to_dict())
-            return post.to_dict(include_author=True), 201
+            db.session.commit()
+            return result, 201
 
     @posts_ns.route('/<int:id>')
     @posts_ns.param('id', 'Post identifier')
     class PostItem(Resource):
         @posts_ns.doc('get_post')
-        @posts_ns.marshal_with(post_output_model)
+        @posts_ns.response(200, 'Success', post_output_model)
         @posts_ns.response(404, 'Post not found')
         def get(self, id):
             """Get post by ID (with author info)"""
-            post = Post.query.options(joinedload(Post.author)).get_or_404(id)
+            # A single row: joining the author is one query, not two
+            post = Post.query.options(*list_options(joinedload(Post.author))).get_or_404(id)
             if post.deleted_at:
                 return {'message': 'Post not found'}, 404
 
-            # Increment view count
-            post.view_count += 1
+            # Increment view count in one atomic UPDATE: concurrent readers
+            # can't overwrite each other's increments, and RETURNING hands
+            # back the new values without reloading the post and its author
+            result = post.to_dict(include_author=True)
+            view_count, updated_at = db.session.execute(
+                update(Post).where(Post.id == id)
+                            .values(view_count=Post.view_count + 1)
+                            .returning(Post.view_count, Post.updated_at),
+                execution_options={'synchronize_session': False}
+            ).one()
             db.session.commit()
 
-            return post.to_dict(include_author=True)
+            result['view_count'] = view_count
+            result['updated_at'] = updated_at.isoformat()
+            return result
 
         @posts_ns.doc('update_post')
         @posts_ns.expect(post_input_model)
-        @posts_ns.marshal_with(post_output_model)
+        @posts_ns.response(200, 'Success', post_output_model)
         @posts_ns.response(404, 'Post not found')
         def put(self, id):
             """Update post"""
-            post = Post.query.get_or_404(id)
+            post = Post.query.options(*list_options(joinedload(Post.author))).get_or_404(id)
             if post.deleted_at:
                 return {'message': 'Post not found'}, 404
 
@@ -732,44 +988,45 @@ def create_app():
             if 'status' in data:
                 post.status = data['status']
 
-            db.session.commit()
-
+            db.session.flush()  # applies the update, so new_values has updated_at
+            result = post.to_dict(include_author=True)
             log_audit(post.user_id, 'update', 'posts', id, old_values=old_values, new_values=post.to_dict())
-            return post.to_dict(include_author=True)
+            db.session.commit()
+            return result
 
         @posts_ns.doc('delete_post')
         @posts_ns.response(204, 'Post deleted')
         @posts_ns.response(404, 'Post not found')
         def delete(self, id):
             """Soft delete post"""
-            post = Post.query.get_or_404(id)
-            if post.deleted_at:
+            row = soft_delete(Post, id)
+            if row is None:
                 return {'message': 'Post not found'}, 404
 
-            old_values = post.to_dict()
-            post.deleted_at = datetime.utcnow()
+            log_audit(row['user_id'], 'delete', 'posts', id,
+                      old_values={'deleted_at': None}, new_values=dict(row))
             db.session.commit()
-
-            log_audit(post.user_id, 'delete', 'posts', id, old_values=old_values)
             return '', 204
 
     @posts_ns.route('/<int:id>/restore')
     @posts_ns.param('id', 'Post identifier')
     class PostRestore(Resource):
         @posts_ns.doc('restore_post')
-        @posts_ns.marshal_with(post_output_model)
+        @posts_ns.response(200, 'Success', post_output_model)
         @posts_ns.response(404, 'Post not found or not deleted')
         def post(self, id):
             """Restore soft-deleted post"""
-            post = Post.query.get_or_404(id)
+            post = Post.query.options(*list_options(joinedload(Post.author))).get_or_404(id)
             if not post.deleted_at:
                 return {'message': 'Post is not deleted'}, 404
 
             post.deleted_at = None
-            db.session.commit()
+            db.session.flush()
 
+            result = post.to_dict(include_author=True)
             log_audit(post.user_id, 'restore', 'posts', id, new_values=post.to_dict())
-            return post.to_dict(include_author=True)
+            db.session.commit()
+            return result
 
     # ============================================================================
     # AUDIT LOG ENDPOINTS
@@ -778,7 +1035,7 @@ def create_app():
     @audit_ns.route('/')
     class AuditLogList(Resource):
         @audit_ns.doc('list_audit_logs')
-        @audit_ns.marshal_list_with(audit_output_model)
+        @audit_ns.response(200, 'Success', [audit_output_model])
         @audit_ns.param('table_name', 'Filter by table name')
         @audit_ns.param('record_id', 'Filter by record ID')
         @audit_ns.param('action', 'Filter by action (create/update/delete)')
@@ -793,7 +1050,8 @@ def create_app():
             if 'action' in request.args:
                 query = query.filter_by(action=request.args['action'])
 
-            logs = query.order_by(AuditLog.created_at.desc()).limit(100).all()
+            # id breaks created_at ties so the order is deterministic
+            logs = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(100).all()
             return [log.to_dict() for log in logs]
 
     # ============================================================================
@@ -831,7 +1089,7 @@ if __name__ == '__main__':
     print("  - Multi-tenancy: Data isolated by organization_id")
     print("  - Audit trail: All changes logged to audit_logs table")
     print("  - Soft deletes: deleted_at column instead of actual deletion")
-    print("  - N+1 prevention: joinedload() for eager loading")
+    print("  - N+1 prevention: joinedload() / batched IN queries for related rows")
     print("  - Indexes: Composite indexes for common query patterns")
     print("\n🌐 Swagger UI: http://localhost:5000/swagger")
     print("🗄️  Supabase UI: View your data in Supabase dashboard")